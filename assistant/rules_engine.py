@@ -132,8 +132,8 @@ class TFTAssistant:
             # Try to enhance with vision data for numerical values
             vision_data = None
             try:
-                from vision.game_state_analyzer import GameStateAnalyzer
-                vision_analyzer = GameStateAnalyzer()
+                from vision.game_state_analyzer import get_game_analyzer
+                vision_analyzer = get_game_analyzer()
                 vision_data = vision_analyzer.get_game_stats_only()
                 logger.info("Successfully retrieved vision data for game stats")
             except Exception as vision_error:
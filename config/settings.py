@@ -17,6 +17,8 @@ class OCRSettings:
     template_dir: str = "champ_templates"
     screenshot_dir: str = "assets/screenshots"
     slot_dir: str = "assets/slots"
+    debug_screenshots: bool = False
+    use_opencl: bool = False
 
 @dataclass 
 class GeminiSettings:
@@ -161,6 +163,16 @@ class ConfigManager:
             except ValueError:
                 logger.warning(f"Invalid OCR_CONFIDENCE value: {ocr_confidence}")
         
+        # Debug screenshot dumps from the game state analyzer
+        debug_screenshots = os.getenv("DEBUG_SCREENSHOTS")
+        if debug_screenshots:
+            settings.ocr.debug_screenshots = debug_screenshots.lower() in ("1", "true", "yes", "on")
+        
+        # OpenCL template matching in the game state analyzer
+        use_opencl = os.getenv("USE_OPENCL")
+        if use_opencl:
+            settings.ocr.use_opencl = use_opencl.lower() in ("1", "true", "yes", "on")
+        
         # Gemini timeout
         gemini_timeout = os.getenv("GEMINI_TIMEOUT")
         if gemini_timeout:
@@ -1,6 +1,5 @@
-import pyautogui
+import mss
 import os
-import time
 from PIL import Image
 import pytesseract
 
@@ -19,16 +18,49 @@ shop_regions = [
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 SCREENSHOT_DIR = os.path.join(BASE_DIR, "assets", "screenshots")
 
+# Per-slot capture and OCR scratch paths, built once instead of every tick
+SLOT_PATHS = tuple(os.path.join(SCREENSHOT_DIR, f"slot_{i+1}.png") for i in range(len(shop_regions)))
+OCR_PATHS = tuple(os.path.join(SCREENSHOT_DIR, f"ocr_{i+1}.png") for i in range(len(shop_regions)))
+OCR_LIST_PATH = os.path.join(SCREENSHOT_DIR, "ocr_batch.txt")
+
+# mss region dicts, and a grabber created lazily in the capturing thread
+SLOT_REGIONS = tuple(
+    {"left": left, "top": top, "width": width, "height": height}
+    for left, top, width, height in shop_regions
+)
+_sct = None
+
+# Directories already created this run, so the capture loop skips the mkdir syscalls
+_ready_dirs = set()
+
+
+def _ensure_dir(path):
+    if path not in _ready_dirs:
+        os.makedirs(path, exist_ok=True)
+        _ready_dirs.add(path)
+
+
+def _get_sct():
+    global _sct
+    if _sct is None:
+        _sct = mss.mss()
+    return _sct
+
 
 def capture_shop(save_dir=SCREENSHOT_DIR):
-    os.makedirs(save_dir, exist_ok=True)
-   
-    
+    _ensure_dir(save_dir)
+
+    if save_dir == SCREENSHOT_DIR:
+        slot_paths = SLOT_PATHS
+    else:
+        slot_paths = [os.path.join(save_dir, f"slot_{i+1}.png") for i in range(len(shop_regions))]
 
+    sct = _get_sct()
     paths = []
-    for i, region in enumerate(shop_regions):
-        path = os.path.join(save_dir, f"slot_{i+1}.png")
-        screenshot = pyautogui.screenshot(region=region)
+    for region, path in zip(SLOT_REGIONS, slot_paths):
+        sct_img = sct.grab(region)
+        # Decode straight from the BGRA buffer; no intermediate RGB copy
+        screenshot = Image.frombuffer("RGB", sct_img.size, sct_img.raw, "raw", "BGRX", 0, 1)
         screenshot.save(path)
         print(f"Saved: {path}")
         paths.append(path)
@@ -48,24 +80,49 @@ def delete_screenshots(directory=SCREENSHOT_DIR):
     print(f"Deleted {count} screenshot(s) from {directory}.")
 
 
+OCR_CONFIG = r'--psm 7 --oem 3 -c tessedit_char_whitelist=abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+
+
+def _preprocess_for_ocr(path):
+    image = Image.open(path)
+    image = image.resize((image.width * 3, image.height * 3), resample=Image.Resampling.LANCZOS)
+    return image.convert("L")
+
+
 def extract_text_from_images(image_paths):
-    results = []
-    for path in image_paths:
+    # Hand tesseract a list file so the whole batch runs in one process;
+    # pages come back separated by form feeds.
+    results = [None] * len(image_paths)
+    present = []
+    processed_paths = []
+    for i, path in enumerate(image_paths):
         if not os.path.exists(path):
             print(f"Missing file: {path}")
-            results.append(None)
             continue
+        present.append(i)
+        # Batches larger than the shop get extra scratch files past the precomputed ones
+        processed_paths.append(OCR_PATHS[i] if i < len(OCR_PATHS) else os.path.join(SCREENSHOT_DIR, f"ocr_{i+1}.png"))
+
+    if not present:
+        return results
+
+    _ensure_dir(SCREENSHOT_DIR)
+    for i, processed_path in zip(present, processed_paths):
+        _preprocess_for_ocr(image_paths[i]).save(processed_path)
+
+    with open(OCR_LIST_PATH, "w") as f:
+        f.write("\n".join(processed_paths) + "\n")
 
-        image = Image.open(path)
-        image = image.resize((image.width * 3, image.height * 3), resample=Image.Resampling.LANCZOS)
-        image = image.convert("L")
+    pages = pytesseract.image_to_string(OCR_LIST_PATH, config=OCR_CONFIG).split("\f")
 
-        config = r'--psm 7 --oem 3 -c tessedit_char_whitelist=abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
-        text = pytesseract.image_to_string(image, config=config)
+    if len(pages) < len(present):
+        print(f"Batch OCR returned {len(pages)} page(s) for {len(present)} image(s), retrying individually")
+        pages = [pytesseract.image_to_string(_preprocess_for_ocr(image_paths[i]), config=OCR_CONFIG) for i in present]
 
+    for i, text in zip(present, pages):
         cleaned = text.strip().replace("\n", " ")
-        results.append(cleaned)
+        results[i] = cleaned
         print(f"OCR: {cleaned}")
 
     print(f"\nAll OCR results: {results}")
-    return results
\ No newline at end of file
+    return results
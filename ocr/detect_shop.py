@@ -1,11 +1,53 @@
 import pyautogui
 import time
+import hashlib
 import logging
 from pathlib import Path
 from typing import Optional, Tuple
 
+from ocr.capture import shop_regions
+
 logger = logging.getLogger(__name__)
 
+# Bounding box (left, top, width, height) of the five shop slot cards, which
+# animate in after a refresh
+_slot_left = min(left for left, _, _, _ in shop_regions[:5])
+_slot_top = min(top for _, top, _, _ in shop_regions[:5])
+_SLOT_STRIP_REGION = (
+    _slot_left,
+    _slot_top,
+    max(left + width for left, _, width, _ in shop_regions[:5]) - _slot_left,
+    max(top + height for _, top, _, height in shop_regions[:5]) - _slot_top,
+)
+
+def _wait_for_stable_frame(
+    region: Tuple[int, int, int, int],
+    poll_interval: float = 0.1,
+    max_wait: float = 2.0
+) -> bool:
+    """Poll a screen region until two consecutive frames are identical.
+    
+    Args:
+        region: (left, top, width, height) region to watch
+        poll_interval: Delay between frame grabs in seconds
+        max_wait: Upper bound on the wait in seconds
+        
+    Returns:
+        True if the region settled, False if max_wait elapsed first
+    """
+    deadline = time.time() + max_wait
+    previous = None
+    
+    while time.time() < deadline:
+        frame = pyautogui.screenshot(region=region)
+        digest = hashlib.md5(frame.tobytes()).digest()
+        if digest == previous:
+            return True
+        previous = digest
+        time.sleep(poll_interval)
+    
+    return False
+
 def wait_for_shop(
     path: str = "photo/reroll_text.png", 
     confidence: float = 0.8,
@@ -47,7 +89,10 @@ def wait_for_shop(
             location = pyautogui.locateOnScreen(str(full_path), confidence=confidence)
             if location:
                 logger.info(f"Shop detected at {location}")
-                time.sleep(2)  # Brief pause for stability
+                # Wait for the slot cards to finish animating in instead of a fixed
+                # pause; the reroll label itself is static, so watch the slots
+                if not _wait_for_stable_frame(_SLOT_STRIP_REGION):
+                    logger.debug("Shop region still changing, continuing anyway")
                 return True
                 
         except pyautogui.ImageNotFoundException:
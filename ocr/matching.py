@@ -2,10 +2,43 @@ import json
 import logging
 from typing import List, Dict, Any, Optional
 from pathlib import Path
+from dataclasses import dataclass
 from rapidfuzz import process, fuzz
 
 logger = logging.getLogger(__name__)
 
+@dataclass
+class ChampionIndex:
+    """Parallel name arrays built once from a champion list."""
+    champions: List[Dict[str, Any]]
+    names_orig: List[str]
+    names_lower: List[str]
+    by_lower: Dict[str, Dict[str, Any]]
+
+    @classmethod
+    def build(cls, champions: List[Dict[str, Any]]) -> 'ChampionIndex':
+        valid = [c for c in champions if isinstance(c, dict) and "name" in c]
+        names_orig = [c.get("name", "") for c in valid]
+        names_lower = [n.lower() for n in names_orig]
+        by_lower = {}
+        for name, champ in zip(names_lower, valid):
+            by_lower.setdefault(name, champ)  # first entry wins, as in a linear scan
+        return cls(champions, names_orig, names_lower, by_lower)
+
+# Champion data is loaded once per process, so a single cached index suffices
+_champ_index: Optional[ChampionIndex] = None
+
+def _get_index(champions: List[Dict[str, Any]]) -> ChampionIndex:
+    """Return the cached index for this champion list, rebuilding if it changed."""
+    global _champ_index
+    if (
+        _champ_index is None
+        or _champ_index.champions is not champions
+        or len(_champ_index.champions) != len(champions)
+    ):
+        _champ_index = ChampionIndex.build(champions)
+    return _champ_index
+
 def load_champ(path: str) -> List[Dict[str, Any]]:
     """Load champion data from JSON file.
     
@@ -66,24 +99,18 @@ def match_champ(
         return None
     
     name_clean = name.strip().lower()
+    index = _get_index(champions)
     
     # Try exact match first
-    for champ in champions:
-        if not isinstance(champ, dict) or "name" not in champ:
-            continue
-        
-        champ_name = champ.get("name", "").lower()
-        if champ_name == name_clean:
-            logger.debug(f"Exact match found: {name} -> {champ['name']}")
-            return champ
+    champ = index.by_lower.get(name_clean)
+    if champ is not None:
+        logger.debug(f"Exact match found: {name} -> {champ['name']}")
+        return champ
     
     # Try fuzzy matching if enabled
     if use_fuzzy and 0 <= threshold <= 100:
         try:
-            champion_names = [
-                champ.get("name", "") for champ in champions 
-                if isinstance(champ, dict) and "name" in champ
-            ]
+            champion_names = index.names_orig
             
             if not champion_names:
                 logger.warning("No valid champion names found for fuzzy matching")
@@ -99,11 +126,10 @@ def match_champ(
             
             if result:
                 matched_name, score, _ = result
-                # Find the champion data for the matched name
-                for champ in champions:
-                    if champ.get("name", "").lower() == matched_name.lower():
-                        logger.info(f"Fuzzy match found: {name} -> {matched_name} (score: {score:.1f})")
-                        return champ
+                champ = index.by_lower.get(matched_name.lower())
+                if champ is not None:
+                    logger.info(f"Fuzzy match found: {name} -> {matched_name} (score: {score:.1f})")
+                    return champ
                         
         except Exception as e:
             logger.error(f"Error during fuzzy matching: {e}")
@@ -130,10 +156,7 @@ def find_similar_champions(
         return []
     
     try:
-        champion_names = [
-            champ.get("name", "") for champ in champions 
-            if isinstance(champ, dict) and "name" in champ
-        ]
+        champion_names = _get_index(champions).names_orig
         
         results = process.extract(
             name,
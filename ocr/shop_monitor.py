@@ -5,9 +5,10 @@ from ocr.matching import load_champ, match_champ
 
 def monitor_shop_loop_once(champions):
     image_paths = capture_shop()
-    champ_names = extract_text_from_images(image_paths[:5])
-    gold = extract_text_from_images(image_paths[6])
-    level = extract_text_from_images(image_paths[7])
+    texts = extract_text_from_images(image_paths)
+    champ_names = texts[:5]
+    gold = texts[5]
+    level = texts[6]
 
     matched = []
     for name in champ_names:
@@ -1,14 +1,46 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+import re
 import time
 from pathlib import Path
-from bs4 import BeautifulSoup
-import json
-from typing import List, Tuple, Optional, Union
+from lxml import etree, html as lxml_html
+import orjson
+from typing import Iterable, List, Tuple, Optional, Union
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Shared session so retries and repeat scrapes reuse pooled keep-alive connections
+_session: Optional[requests.Session] = None
+_session_retries: Optional[int] = None
+
+def _get_session(max_retries: int) -> requests.Session:
+    """Get the shared scraping session, remounting its retry policy if it changed.
+    
+    Args:
+        max_retries: Maximum number of attempts per request
+        
+    Returns:
+        Configured requests session
+    """
+    global _session, _session_retries
+    if _session is None:
+        _session = requests.Session()
+        _session.headers.update({"User-Agent": "Mozilla/5.0", "Connection": "keep-alive"})
+    
+    if _session_retries != max_retries:
+        retry = Retry(
+            total=max(0, max_retries - 1),  # urllib3 counts retries after the first attempt
+            backoff_factor=1,
+            status_forcelist=[500, 502, 503, 504]
+        )
+        _session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+        _session_retries = max_retries
+    
+    return _session
+
 @dataclass
 class ChampData:
     """Data class for champion information."""
@@ -35,42 +67,61 @@ class TraitData:
             "breaks": self.breaks
         }
 
+def _class_xpath(tag: str, class_name: str, expr: str = "{path}") -> etree.XPath:
+    """Compile a descendant lookup matching a tag and a whole CSS class token."""
+    path = f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+    return etree.XPath(expr.format(path=path))
+
+def _first(matches: list):
+    """Return the first XPath match or None."""
+    return matches[0] if matches else None
+
+# Compiled once at import so each query is a single libxml2 tree walk
+_CHAMP_XPATH = _class_xpath("div", "champions-wrap__details")
+_CHAMP_INFO_XPATH = _class_xpath("div", "champions-wrap__details__champion__info")
+_CHAMP_NAME_XPATH = _class_xpath("span", "name", "string(({path})[1])")
+_CHAMP_COST_XPATH = _class_xpath("span", "cost", "string(({path})[1])")
+_IMG_SRC_XPATH = etree.XPath(".//img/@src")
+_SYNERGIES_XPATH = _class_xpath("div", "synergies-wrap")
+_ORIGINS_XPATH = _class_xpath("div", "origins")
+_CLASSES_XPATH = _class_xpath("div", "classes")
+_TRAIT_XPATH = _class_xpath("div", "details")
+_TRAIT_IMG_SRC_XPATH = _class_xpath("div", "details__pic", "({path})[1]//img/@src")
+_BREAKS_LIST_XPATH = _class_xpath("ul", "bbcode_list", "({path})[1]")
+_BREAK_ITEM_XPATH = etree.XPath(".//li")
+_STRING_XPATH = etree.XPath("string()")
+
+# A trait break is the digit leading a list item, e.g. "3 Rebels" -> 3
+_LEADING_DIGIT = re.compile(r"^\s*(\d)")
+
 def extract_traits(section) -> List[TraitData]:
     """Extract trait data from a webpage section.
     
     Args:
-        section: BeautifulSoup section containing trait information
+        section: lxml element containing trait information
         
     Returns:
         List of TraitData objects
     """
     traits = []
-    if not section:
+    if section is None:
         return traits
     
     try:
-        for div in section.find_all("div", class_="details"):
+        for div in _TRAIT_XPATH(section):
             try:
-                img_div = div.find("div", class_="details__pic")
-                if not img_div:
+                src = _first(_TRAIT_IMG_SRC_XPATH(div))
+                if not src:
                     continue
                     
-                img_tag = img_div.find("img")
-                if not img_tag or not img_tag.get("src"):
-                    continue
-                    
-                name = Path(img_tag["src"]).stem
+                name = Path(src).stem
                 
-                ul = div.find("ul", class_="bbcode_list")
-                if ul:
-                    breaks = []
-                    for li in ul.find_all("li"):
-                        text = li.text.strip()
-                        if text and text[0].isdigit():
-                            try:
-                                breaks.append(int(text[0]))
-                            except ValueError:
-                                logger.warning(f"Could not parse break value: {text}")
+                ul = _first(_BREAKS_LIST_XPATH(div))
+                if ul is not None:
+                    breaks = [
+                        int(m.group(1)) for li in _BREAK_ITEM_XPATH(ul)
+                        if (m := _LEADING_DIGIT.match(_STRING_XPATH(li)))
+                    ]
                 else:
                     breaks = [1]
                 
@@ -85,6 +136,53 @@ def extract_traits(section) -> List[TraitData]:
     
     return traits
 
+def _parse_champion(div) -> Optional[ChampData]:
+    """Parse a single champions-wrap__details element.
+    
+    Args:
+        div: lxml element for one champion
+        
+    Returns:
+        ChampData, or None if the element has no champion info
+    """
+    info = _first(_CHAMP_INFO_XPATH(div))
+    if info is None:
+        return None
+    
+    # Extract champion name
+    name = _CHAMP_NAME_XPATH(info).strip() or "Unknown"
+    
+    # Extract champion cost
+    cost_text = _CHAMP_COST_XPATH(info).strip()
+    cost = 0
+    try:
+        # Remove the trailing currency symbol
+        cost = int(cost_text[:-1]) if cost_text and cost_text[:-1].isdigit() else 0
+    except (ValueError, IndexError):
+        logger.warning(f"Could not parse cost for {name}: {cost_text}")
+    
+    # Extract champion traits
+    traits = []
+    for src in _IMG_SRC_XPATH(info):
+        if src:
+            try:
+                trait_name = Path(src).stem
+                traits.append(trait_name)
+            except Exception as e:
+                logger.warning(f"Error parsing trait image: {e}")
+    
+    return ChampData(name, cost, traits)
+
+def _parse_synergies(synergies) -> List[TraitData]:
+    """Parse origin and class traits from a synergies-wrap element."""
+    origins = _first(_ORIGINS_XPATH(synergies))
+    classes = _first(_CLASSES_XPATH(synergies))
+    return extract_traits(origins) + extract_traits(classes)
+
+def _has_class(elem, class_name: str) -> bool:
+    """Check whether an element carries a CSS class token."""
+    return class_name in (elem.get("class") or "").split()
+
 def parse_page(html: str) -> Tuple[List[ChampData], List[TraitData]]:
     """Parse champion and trait data from HTML content.
     
@@ -99,53 +197,21 @@ def parse_page(html: str) -> Tuple[List[ChampData], List[TraitData]]:
         return [], []
     
     try:
-        soup = BeautifulSoup(html, "html.parser")
+        doc = lxml_html.fromstring(html)
         champs = []
 
-        for div in soup.find_all("div", class_="champions-wrap__details"):
+        for div in _CHAMP_XPATH(doc):
             try:
-                info = div.find("div", class_="champions-wrap__details__champion__info")
-                if not info:
-                    continue
-                
-                # Extract champion name
-                name_tag = info.find("span", class_="name")
-                name = name_tag.text.strip() if name_tag else "Unknown"
-                
-                # Extract champion cost
-                cost_tag = info.find("span", class_="cost")
-                cost = 0
-                if cost_tag:
-                    cost_text = cost_tag.text.strip()
-                    try:
-                        # Remove the trailing currency symbol
-                        cost = int(cost_text[:-1]) if cost_text and cost_text[:-1].isdigit() else 0
-                    except (ValueError, IndexError):
-                        logger.warning(f"Could not parse cost for {name}: {cost_text}")
-                
-                # Extract champion traits
-                traits = []
-                for img in info.find_all("img"):
-                    src = img.get("src")
-                    if src:
-                        try:
-                            trait_name = Path(src).stem
-                            traits.append(trait_name)
-                        except Exception as e:
-                            logger.warning(f"Error parsing trait image: {e}")
-                
-                champs.append(ChampData(name, cost, traits))
-                
+                champ = _parse_champion(div)
+                if champ:
+                    champs.append(champ)
             except Exception as e:
                 logger.warning(f"Error parsing champion div: {e}")
                 continue
 
         # Extract synergies (traits)
-        synergies = soup.find("div", class_="synergies-wrap")
-        origins = synergies.find("div", class_="origins") if synergies else None
-        classes = synergies.find("div", class_="classes") if synergies else None
-
-        traits = extract_traits(origins) + extract_traits(classes)
+        synergies = _first(_SYNERGIES_XPATH(doc))
+        traits = _parse_synergies(synergies) if synergies is not None else []
         
         logger.info(f"Parsed {len(champs)} champions and {len(traits)} traits")
         return champs, traits
@@ -154,6 +220,90 @@ def parse_page(html: str) -> Tuple[List[ChampData], List[TraitData]]:
         logger.error(f"Error parsing HTML page: {e}")
         return [], []
 
+def parse_stream(
+    chunks: Iterable[bytes],
+    encoding: Optional[str] = None
+) -> Tuple[List[ChampData], List[TraitData]]:
+    """Parse champion and trait data incrementally from raw HTML chunks.
+    
+    Champion and synergy elements are handled as soon as their closing tag
+    arrives. Every finished element outside them is cleared and detached
+    from its parent, so memory stays bounded by the DOM depth and the
+    largest champion or synergy block rather than the page size.
+    
+    Args:
+        chunks: Iterable of raw HTML byte chunks (e.g. response.iter_content())
+        encoding: Document encoding if known, otherwise detected by lxml
+        
+    Returns:
+        Tuple of (champions, traits) lists
+        
+    Raises:
+        requests.RequestException: If reading the chunks fails on the network
+    """
+    champs = []
+    traits = []
+    
+    # Number of champion/synergy containers currently open; their contents
+    # must stay in the tree until the container itself has been parsed
+    open_containers = 0
+    
+    def is_container(elem) -> bool:
+        return elem.tag == "div" and (
+            _has_class(elem, "champions-wrap__details") or _has_class(elem, "synergies-wrap")
+        )
+    
+    def handle_events() -> None:
+        nonlocal open_containers
+        for event, elem in parser.read_events():
+            if event == "start":
+                if is_container(elem):
+                    open_containers += 1
+                continue
+            
+            if is_container(elem):
+                open_containers -= 1
+                if _has_class(elem, "champions-wrap__details"):
+                    try:
+                        champ = _parse_champion(elem)
+                        if champ:
+                            champs.append(champ)
+                    except Exception as e:
+                        logger.warning(f"Error parsing champion div: {e}")
+                elif not traits:
+                    traits.extend(_parse_synergies(elem))
+            
+            if open_containers:
+                # Nested inside another container that still needs its children
+                continue
+            
+            # Release the finished element and every finished sibling before it
+            elem.clear()
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+    
+    try:
+        parser = etree.HTMLPullParser(events=("start", "end"), encoding=encoding)
+        for chunk in chunks:
+            if chunk:
+                parser.feed(chunk)
+                handle_events()
+        parser.close()
+        handle_events()
+        
+        logger.info(f"Parsed {len(champs)} champions and {len(traits)} traits")
+        return champs, traits
+        
+    except requests.RequestException:
+        # Network failures while streaming are the caller's to retry, not parse errors
+        raise
+        
+    except Exception as e:
+        logger.error(f"Error parsing HTML stream: {e}")
+        return [], []
+
 def scrape_to_json(
     output_dir: str = "data",
     timeout: float = 30.0,
@@ -172,41 +322,44 @@ def scrape_to_json(
     url = "https://www.mobafire.com/teamfight-tactics/champions"
     logger.info(f"Scraping TFT data from {url}")
 
-    for attempt in range(max_retries):
+    # The session's Retry only covers connecting and the response status, so
+    # failures while streaming the body are retried here
+    attempts = max(1, max_retries)
+    for attempt in range(1, attempts + 1):
         try:
-            logger.info(f"Attempt {attempt + 1}/{max_retries}")
-            
-            response = requests.get(url, timeout=timeout)
-            response.raise_for_status()
-            
-            logger.info(f"Successfully fetched data ({len(response.text)} characters)")
-            break
+            response = _get_session(max_retries).get(url, timeout=timeout, stream=True)
             
         except requests.exceptions.Timeout:
-            logger.warning(f"Request timeout on attempt {attempt + 1}")
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)  # Exponential backoff
-                continue
             logger.error("All retry attempts failed due to timeout")
             return None, None
             
+        except requests.RequestException as e:
+            logger.error(f"Request error after {max_retries} attempt(s): {e}")
+            return None, None
+        
+        try:
+            with response:
+                response.raise_for_status()
+                logger.info("Connected, streaming page data")
+                
+                # Only trust an explicit header charset; otherwise let lxml read the page's meta tag
+                content_type = response.headers.get("Content-Type", "").lower()
+                encoding = response.encoding if "charset" in content_type else None
+                champs, traits = parse_stream(response.iter_content(chunk_size=65536), encoding)
+            break
+            
         except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error on attempt {attempt + 1}: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
-                continue
+            logger.error(f"HTTP error: {e}")
             return None, None
             
         except requests.RequestException as e:
-            logger.error(f"Request error on attempt {attempt + 1}: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
-                continue
-            return None, None
+            if attempt == attempts:
+                logger.error(f"Network error while streaming page after {attempts} attempt(s): {e}")
+                return None, None
+            logger.warning(f"Network error while streaming page (attempt {attempt}/{attempts}), retrying: {e}")
+            time.sleep(attempt)
 
     try:
-        champs, traits = parse_page(response.text)
-        
         if not champs:
             logger.error("No champions found in scraped data")
             return None, None
@@ -218,22 +371,18 @@ def scrape_to_json(
         traits_file = output_path / "traits.json"
 
         # Save champions data
-        with open(champs_file, "w", encoding="utf-8") as cf:
-            json.dump(
-                [c.asdict() for c in sorted(champs, key=lambda c: c.name)], 
-                cf, 
-                indent=4,
-                ensure_ascii=False
-            )
+        with open(champs_file, "wb") as cf:
+            cf.write(orjson.dumps(
+                [c.asdict() for c in sorted(champs, key=lambda c: c.name)],
+                option=orjson.OPT_INDENT_2
+            ))
 
         # Save traits data
-        with open(traits_file, "w", encoding="utf-8") as tf:
-            json.dump(
-                [t.asdict() for t in sorted(traits, key=lambda t: t.name)], 
-                tf, 
-                indent=4,
-                ensure_ascii=False
-            )
+        with open(traits_file, "wb") as tf:
+            tf.write(orjson.dumps(
+                [t.asdict() for t in sorted(traits, key=lambda t: t.name)],
+                option=orjson.OPT_INDENT_2
+            ))
 
         logger.info(f"Champions saved to: {champs_file}")
         logger.info(f"Traits saved to: {traits_file}")
@@ -1,9 +1,21 @@
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
 
+# Background listener that performs the actual handler I/O
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+def _stop_log_listener() -> None:
+    """Flush queued records and stop the background logging thread."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
 def setup_logging(
     level: str = "INFO",
     log_file: Optional[str] = None,
@@ -13,6 +25,9 @@ def setup_logging(
 ) -> None:
     """Setup application logging with both console and file handlers.
     
+    Application threads only enqueue records; a background QueueListener
+    thread formats them and writes to the console and log file.
+    
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to log file (None for no file logging)
@@ -30,8 +45,9 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, level.upper()))
     
-    # Clear any existing handlers
+    # Clear any existing handlers and stop a previous listener
     root_logger.handlers.clear()
+    _stop_log_listener()
     
     # Create formatter
     formatter = logging.Formatter(format_str)
@@ -40,7 +56,7 @@ def setup_logging(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(getattr(logging, level.upper()))
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler (if specified)
     if log_file:
@@ -50,11 +66,19 @@ def setup_logging(
         file_handler = logging.handlers.RotatingFileHandler(
             log_path,
             maxBytes=max_file_size,
-            backupCount=backup_count
+            backupCount=backup_count,
+            delay=True  # Don't open the file until the first record is written
         )
         file_handler.setLevel(getattr(logging, level.upper()))
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Route records through a queue so logging never blocks on disk I/O
+    global _log_listener
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
     
     # Log initial message
     logger = logging.getLogger(__name__)
@@ -62,6 +86,8 @@ def setup_logging(
     if log_file:
         logger.info(f"Log file: {log_file}")
 
+atexit.register(_stop_log_listener)
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance for the given name."""
     return logging.getLogger(name)
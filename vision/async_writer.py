@@ -0,0 +1,137 @@
+import atexit
+import logging
+import queue
+import threading
+import weakref
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Queue marker that tells the writer thread to exit
+_STOP = object()
+
+# Live writers, flushed by a single exit hook without keeping them alive
+_live_writers: "weakref.WeakSet[AsyncFileWriter]" = weakref.WeakSet()
+
+def _close_live_writers() -> None:
+    """Flush and stop every writer still running at interpreter exit."""
+    for writer in list(_live_writers):
+        writer.close()
+
+atexit.register(_close_live_writers)
+
+class AsyncFileWriter:
+    """Writes files from a background thread so callers never block on disk I/O.
+
+    Pending writes are drained in batches: the thread wakes on the first queued
+    item, collects everything else already waiting, and writes the lot before
+    sleeping again. Images are encoded on the writer thread too, and when the
+    queue is full new writes are dropped rather than stalling the caller.
+    """
+
+    def __init__(self, maxsize: int = 4, batch_size: int = 32):
+        """Start the background writer thread.
+
+        Args:
+            maxsize: Maximum number of pending writes (0 for unbounded)
+            batch_size: Maximum number of files written per wake-up
+        """
+        self.batch_size = batch_size
+        self.dropped = 0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._run, name="async-file-writer", daemon=True)
+        self._thread.start()
+        _live_writers.add(self)
+
+    def submit(self, path: Path, data: bytes) -> bool:
+        """Queue bytes to be written to a file.
+
+        Args:
+            path: Destination file path
+            data: File contents
+
+        Returns:
+            True if queued, False if the queue was full and the write was dropped
+        """
+        return self._enqueue((path, data, None))
+
+    def submit_image(self, path: Path, image: np.ndarray, params: Optional[Sequence[int]] = None) -> bool:
+        """Queue an image to be encoded (format from the path suffix) and written.
+
+        The image must not be modified after submission; pass a copy if the
+        caller keeps drawing on it.
+
+        Args:
+            path: Destination file path
+            image: OpenCV image to encode
+            params: cv2.imencode parameters, e.g. [cv2.IMWRITE_JPEG_QUALITY, 70]
+
+        Returns:
+            True if queued, False if the queue was full and the write was dropped
+        """
+        return self._enqueue((path, image, list(params or [])))
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Flush pending writes and stop the writer thread.
+
+        Args:
+            timeout: Seconds to wait for pending writes to finish
+        """
+        _live_writers.discard(self)
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    def _enqueue(self, item: Tuple[Path, Union[bytes, np.ndarray], Optional[List[int]]]) -> bool:
+        """Queue an item without blocking, dropping it if the queue is full."""
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            logger.debug(f"Writer queue full, dropped {item[0]}")
+            return False
+
+    def _run(self) -> None:
+        """Writer thread loop: block for one item, then drain a batch."""
+        while True:
+            batch = []
+            item = self._queue.get()
+            while item is not _STOP:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            self._write_batch(batch)
+            if item is _STOP:
+                return
+
+    def _write_batch(self, batch: List[Tuple[Path, Union[bytes, np.ndarray], Optional[List[int]]]]) -> None:
+        """Encode and write a batch of queued files.
+
+        Args:
+            batch: (path, data or image, encode params) items to write
+        """
+        for path, payload, params in batch:
+            try:
+                if params is not None:
+                    ok, buf = cv2.imencode(Path(path).suffix, payload, params)
+                    if not ok:
+                        logger.warning(f"Failed to encode {path}")
+                        continue
+                    payload = buf
+                with open(path, 'wb') as f:
+                    f.write(payload)
+            except Exception as e:
+                logger.error(f"Error writing {path}: {e}")
+
+        if batch:
+            logger.debug(f"Wrote {len(batch)} file(s)")
@@ -1,17 +1,104 @@
 import cv2
 import numpy as np
 import logging
+import os
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
-import json
+import orjson
 
 logger = logging.getLogger(__name__)
 
+def _nms_boxes(boxes: np.ndarray, scores: np.ndarray, iou_thr: float) -> np.ndarray:
+    """Greedy non-maximum suppression over (x, y, w, h) boxes.
+    
+    Keeps the highest-scoring box and drops any later box whose IoU with a
+    kept box exceeds the threshold. Runs in OpenCV's C++ implementation.
+    
+    Args:
+        boxes: (N, 4) array of (x, y, w, h) boxes sorted by descending score
+        scores: (N,) array of scores in the same order
+        iou_thr: IoU above which a lower-scoring box is dropped
+        
+    Returns:
+        Indices into boxes of the boxes to keep, in score order
+    """
+    keep = cv2.dnn.NMSBoxes(
+        boxes.astype(np.int32).tolist(),
+        scores.astype(np.float32).tolist(),
+        score_threshold=0.0,
+        nms_threshold=iou_thr
+    )
+    return np.asarray(keep, dtype=np.int64).flatten()
+
+def _border_mean(img: np.ndarray, bt: int) -> np.ndarray:
+    """Mean color of the four border strips of an image.
+    
+    Corner pixels are counted once per strip they fall in, matching a
+    concatenation of the top, bottom, left and right strips.
+    
+    Args:
+        img: (H, W, 3) image
+        bt: Border thickness in pixels
+        
+    Returns:
+        (3,) float64 mean color
+    """
+    strips = (img[:bt, :], img[-bt:, :], img[:, :bt], img[:, -bt:])
+    pixel_count = sum(strip.shape[0] * strip.shape[1] for strip in strips)
+    return sum(strip.sum(axis=(0, 1), dtype=np.float64) for strip in strips) / pixel_count
+
+# Height every region is scaled to before being stacked into an OCR strip
+_STRIP_ROW_HEIGHT = 48
+
+def _binarize_for_ocr(gray: np.ndarray) -> np.ndarray:
+    """Otsu-threshold a grayscale region to black text on a white background.
+    
+    Args:
+        gray: Grayscale image of the region
+        
+    Returns:
+        Binary image with 0 for text and 255 for background
+    """
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    
+    # Invert if needed (OCR works better with black text on white);
+    # same test as mean < 127 on a 0/255 image, without a float reduction
+    if cv2.countNonZero(binary) * 255 < 127 * binary.size:
+        binary = cv2.bitwise_not(binary)
+    return binary
+
+def _ocr_mode(region_type: str) -> Tuple[int, str]:
+    """Get the Tesseract page segmentation mode and character whitelist for a region.
+    
+    Args:
+        region_type: Type of region (gold, level, etc.)
+        
+    Returns:
+        Tuple of (psm, whitelist); an empty whitelist allows all characters
+    """
+    if region_type in ['gold', 'level', 'health']:
+        # Numbers only, single line
+        return 7, '0123456789'
+    if region_type == 'round':
+        # Numbers and dash for rounds like "2-1"
+        return 7, '0123456789-'
+    # General text, single block
+    return 6, ''
+
 class ChampionDetector:
     """Detects TFT champions using template matching and OCR."""
     
-    def __init__(self):
+    def __init__(self, use_opencl: bool = False):
+        # Run template matching on OpenCL UMats (T-API) instead of the CPU; off by
+        # default since results are only checked against the CPU path
+        self._use_opencl = use_opencl
         self.champion_templates = {}
+        self._scaled_templates = {}
+        # How often each template has been the best match, used to try likely champions first
+        self._template_hits = Counter()
         self.trait_templates = {}
         self.cost_colors = {
             1: [(169, 169, 169), (192, 192, 192)],  # Gray for 1-cost
@@ -20,7 +107,35 @@ class ChampionDetector:
             4: [(128, 0, 128), (186, 85, 211)],     # Purple for 4-cost
             5: [(255, 215, 0), (255, 255, 0)],      # Gold for 5-cost
         }
-        self.load_templates()
+        # Flattened (N, 3) palette with a parallel label array for vectorized matching
+        self._cost_palette = np.array(
+            [color for cost in sorted(self.cost_colors) for color in self.cost_colors[cost]], dtype=np.int16
+        )
+        self._cost_labels = np.array(
+            [cost for cost in sorted(self.cost_colors) for _ in self.cost_colors[cost]], dtype=np.int8
+        )
+        self._champs_path = Path("data/champions.json")
+        self._champ_index_mtime: Optional[float] = None
+        self._champ_index = self._build_champ_index()
+        self._champ_cost_traits = self._build_cost_traits_index(self._champ_index)
+        # OCR modules are imported on first use so detection-only callers never load them
+        self._tesseract = None
+        self._pil_image = None
+        # Persistent tesserocr APIs, one per thread since the API is not thread-safe
+        self._tesserocr = None
+        self._tess_local = threading.local()
+        # Templates are loaded on first match, so OCR-only callers never read them
+        self._templates_loaded = False
+        self._templates_lock = threading.Lock()
+        # matchTemplate releases the GIL, so threads scale across templates
+        self._match_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+    
+    def close(self) -> None:
+        """Stop the template matching threads.
+        
+        The detector must not be used for matching after it is closed.
+        """
+        self._match_pool.shutdown(wait=True)
     
     def load_templates(self):
         """Load champion and trait template images."""
@@ -31,95 +146,412 @@ class ChampionDetector:
                 template = cv2.imread(str(template_file), cv2.IMREAD_COLOR)
                 if template is not None:
                     champion_name = template_file.stem
-                    self.champion_templates[champion_name] = template
+                    # Matching is done in grayscale, so convert once and keep the size alongside
+                    h, w = template.shape[:2]
+                    self.champion_templates[champion_name] = {
+                        'gray': cv2.cvtColor(template, cv2.COLOR_BGR2GRAY),
+                        'h': h,
+                        'w': w
+                    }
                     logger.debug(f"Loaded template for {champion_name}")
             
             logger.info(f"Loaded {len(self.champion_templates)} champion templates")
         else:
             logger.warning(f"Template directory {template_dir} not found")
+        
+        self._templates_loaded = True
+    
+    def _ensure_templates(self) -> None:
+        """Load the champion templates if they haven't been loaded yet."""
+        if not self._templates_loaded:
+            with self._templates_lock:
+                if not self._templates_loaded:
+                    self.load_templates()
     
-    def detect_champion_by_template(self, image: np.ndarray, threshold: float = 0.8) -> List[Dict[str, Any]]:
+    def detect_champion_by_template(
+        self,
+        image: np.ndarray,
+        threshold: float = 0.8,
+        scale: float = 1.0,
+        max_results: Optional[int] = None,
+        early_exit_threshold: float = 0.95
+    ) -> List[Dict[str, Any]]:
         """Detect champions using template matching.
         
         Args:
-            image: Input image to search
+            image: Input image to search (BGR, or already grayscale)
             threshold: Matching confidence threshold
+            scale: Pyramid scale to match at (positions are returned at full resolution)
+            max_results: Maximum detections to return (None for all); with 1, matching
+                stops at the first template scoring at least early_exit_threshold
+            early_exit_threshold: Confidence that ends a single-result search early
             
         Returns:
             List of detected champions with positions and confidence
         """
-        detections = []
-        
+        self._ensure_templates()
         if not self.champion_templates:
             logger.warning("No champion templates loaded")
-            return detections
+            return []
+        
+        # Convert to grayscale for template matching (callers may pass gray already)
+        gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        detections = self._detect_on_gray(gray_image, threshold, scale, max_results, early_exit_threshold)
+        
+        logger.info(f"Detected {len(detections)} champions via template matching")
+        return detections
+    
+    def _detect_on_gray(
+        self,
+        gray_image: np.ndarray,
+        threshold: float,
+        scale: float = 1.0,
+        max_results: Optional[int] = None,
+        early_exit_threshold: float = 0.95
+    ) -> List[Dict[str, Any]]:
+        """Run template matching on an already-grayscale image.
+        
+        Args:
+            gray_image: Grayscale image to search
+            threshold: Matching confidence threshold
+            scale: Pyramid scale to match at (positions are returned at full resolution)
+            max_results: Maximum detections to return (None for all)
+            early_exit_threshold: Confidence that ends a single-result search early
+            
+        Returns:
+            List of detections sorted by confidence with overlaps removed
+        """
+        templates = self._get_scaled_templates(scale)
+        if not templates:
+            return []
+        
+        if scale != 1.0:
+            gray_image = cv2.resize(gray_image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        
+        if max_results == 1:
+            return self._detect_best_on_gray(self._to_search_image(gray_image), templates, threshold, scale, early_exit_threshold)
+        
+        arrays = self._detect_arrays_on_gray(self._to_search_image(gray_image), templates, threshold, scale, max_results)
+        return [
+            {
+                'name': name,
+                'position': (x, y),
+                'size': (w, h),
+                'confidence': confidence,
+                'bounding_box': (x, y, x + w, y + h)
+            }
+            for name, (x, y), (w, h), confidence in zip(
+                arrays['names'],
+                arrays['positions'].tolist(),
+                arrays['sizes'].tolist(),
+                arrays['confidences'].tolist()
+            )
+        ]
+    
+    def detect_champion_arrays(
+        self,
+        image: np.ndarray,
+        threshold: float = 0.8,
+        scale: float = 1.0,
+        max_results: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Detect champions using template matching, returning parallel arrays.
+        
+        Same matching as detect_champion_by_template, but without building a
+        dict per detection.
+        
+        Args:
+            image: Input image to search (BGR, or already grayscale)
+            threshold: Matching confidence threshold
+            scale: Pyramid scale to match at (positions are returned at full resolution)
+            max_results: Maximum detections to return (None for all)
+            
+        Returns:
+            Dictionary with 'names' (list of str), 'positions' and 'sizes'
+            (N x 2 int arrays) and 'confidences' (N float array), sorted by confidence
+        """
+        templates = self._get_scaled_templates(scale)
+        if not templates:
+            logger.warning("No champion templates loaded")
+            return self._empty_detection_arrays()
+        
+        gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        if scale != 1.0:
+            gray_image = cv2.resize(gray_image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        
+        arrays = self._detect_arrays_on_gray(self._to_search_image(gray_image), templates, threshold, scale, max_results)
+        logger.info(f"Detected {len(arrays['names'])} champions via template matching")
+        return arrays
+    
+    def _to_search_image(self, gray_image: np.ndarray) -> Any:
+        """Upload the search image to the OpenCL device once per detection, if enabled.
+        
+        Returns:
+            cv2.UMat when OpenCL matching is enabled, otherwise the array unchanged
+        """
+        if self._use_opencl:
+            return cv2.UMat(gray_image)
+        return gray_image
+    
+    @staticmethod
+    def _empty_detection_arrays() -> Dict[str, Any]:
+        """Detection arrays for an image with no matches."""
+        return {
+            'names': [],
+            'positions': np.empty((0, 2), dtype=np.int64),
+            'sizes': np.empty((0, 2), dtype=np.int64),
+            'confidences': np.empty(0, dtype=np.float32)
+        }
+    
+    def _detect_arrays_on_gray(
+        self,
+        gray_image: np.ndarray,
+        templates: Dict[str, Dict[str, Any]],
+        threshold: float,
+        scale: float,
+        max_results: Optional[int]
+    ) -> Dict[str, Any]:
+        """Match every template and reduce the candidates to NMS survivors.
+        
+        Args:
+            gray_image: Grayscale image to search, already resized for scale (array or cv2.UMat)
+            templates: Template entries for this scale
+            threshold: Matching confidence threshold
+            scale: Scale the image and templates were resized by
+            max_results: Maximum detections to return (None for all)
+            
+        Returns:
+            Detection arrays as described in detect_champion_arrays
+        """
+        names = list(templates)
+        def match(name: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            return self._match_template(gray_image, name, templates[name], threshold, scale)
+        
+        if isinstance(gray_image, cv2.UMat):
+            # A UMat is bound to the thread's OpenCL queue, so match it serially
+            # on this thread; the device parallelizes each match itself
+            results = [match(name) for name in names]
+        else:
+            results = list(self._match_pool.map(match, names))
         
-        # Convert to grayscale for template matching
-        gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        # Gather every candidate into flat arrays
+        counts = [len(xs) for xs, _, _ in results]
+        if not sum(counts):
+            return self._empty_detection_arrays()
         
-        for champion_name, template in self.champion_templates.items():
+        xs = np.concatenate([r[0] for r in results])
+        ys = np.concatenate([r[1] for r in results])
+        confidences = np.concatenate([r[2] for r in results])
+        name_idx = np.repeat(np.arange(len(names)), counts)
+        widths = np.array([templates[name]['w'] for name in names])[name_idx]
+        heights = np.array([templates[name]['h'] for name in names])[name_idx]
+        
+        # Sort by confidence and remove overlapping detections
+        order = np.argsort(-confidences, kind='stable')
+        boxes = np.column_stack([xs, ys, widths, heights])[order]
+        survivors = order[_nms_boxes(boxes, confidences[order], 0.5)][:max_results]
+        
+        return {
+            'names': [names[n] for n in name_idx[survivors].tolist()],
+            'positions': np.column_stack([xs[survivors], ys[survivors]]),
+            'sizes': np.column_stack([widths[survivors], heights[survivors]]),
+            'confidences': confidences[survivors]
+        }
+    
+    def _detect_best_on_gray(
+        self,
+        gray_image: np.ndarray,
+        templates: Dict[str, Dict[str, Any]],
+        threshold: float,
+        scale: float,
+        early_exit_threshold: float
+    ) -> List[Dict[str, Any]]:
+        """Find the single best template match, stopping early on a confident hit.
+        
+        Templates are tried in order of how often they have won before, so
+        champions that keep showing up are found after few matches.
+        
+        Args:
+            gray_image: Grayscale image to search, already resized for scale (array or cv2.UMat)
+            templates: Template entries for this scale
+            threshold: Minimum confidence for a detection
+            scale: Scale the image and templates were resized by
+            early_exit_threshold: Confidence at which to stop trying templates
+            
+        Returns:
+            List with the best detection, or an empty list
+        """
+        best_name = None
+        best_confidence = -1.0
+        best_loc = (0, 0)
+        
+        for name in sorted(templates, key=self._template_hits.__getitem__, reverse=True):
             try:
-                # Convert template to grayscale
-                gray_template = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
-                
-                # Perform template matching
-                result = cv2.matchTemplate(gray_image, gray_template, cv2.TM_CCOEFF_NORMED)
-                locations = np.where(result >= threshold)
-                
-                # Get template dimensions
-                h, w = gray_template.shape
-                
-                # Process matches
-                for pt in zip(*locations[::-1]):  # Switch x and y
-                    confidence = result[pt[1], pt[0]]
-                    
-                    detection = {
-                        'name': champion_name,
-                        'position': pt,
-                        'size': (w, h),
-                        'confidence': float(confidence),
-                        'bounding_box': (pt[0], pt[1], pt[0] + w, pt[1] + h)
-                    }
-                    detections.append(detection)
-                    
+                result = cv2.matchTemplate(gray_image, templates[name]['gray'], cv2.TM_CCOEFF_NORMED)
+                _, max_val, _, max_loc = cv2.minMaxLoc(result)
             except Exception as e:
-                logger.error(f"Error matching template for {champion_name}: {e}")
+                logger.error(f"Error matching template for {name}: {e}")
+                continue
+            
+            if max_val > best_confidence:
+                best_name, best_confidence, best_loc = name, max_val, max_loc
+                if max_val >= early_exit_threshold:
+                    break
         
-        # Sort by confidence and remove overlapping detections
-        detections = sorted(detections, key=lambda x: x['confidence'], reverse=True)
-        detections = self._remove_overlapping_detections(detections)
+        if best_name is None or best_confidence < threshold:
+            return []
         
-        logger.info(f"Detected {len(detections)} champions via template matching")
-        return detections
+        self._template_hits[best_name] += 1
+        x, y = best_loc
+        if scale != 1.0:
+            x, y = int(round(x / scale)), int(round(y / scale))
+        w, h = templates[best_name]['w'], templates[best_name]['h']
+        
+        return [{
+            'name': best_name,
+            'position': (x, y),
+            'size': (w, h),
+            'confidence': best_confidence,
+            'bounding_box': (x, y, x + w, y + h)
+        }]
     
-    def _remove_overlapping_detections(self, detections: List[Dict[str, Any]], overlap_threshold: float = 0.5) -> List[Dict[str, Any]]:
-        """Remove overlapping detections to avoid duplicates."""
-        if not detections:
-            return detections
+    def _detect_best_per_slot(
+        self,
+        gray_strip: np.ndarray,
+        slot_count: int,
+        threshold: float,
+        scale: float = 1.0,
+        early_exit_threshold: float = 0.95
+    ) -> List[Optional[Tuple[str, float]]]:
+        """Find the best template for each of several equal-width slots in one strip.
         
-        filtered = []
+        Each template is matched once over the whole strip, and the result is
+        reduced to a maximum per slot over the positions where the template
+        lies entirely inside that slot. Templates are tried in order of past
+        wins; a slot stops taking new matches once it has a confident hit, and
+        matching stops when every slot has one.
         
-        for detection in detections:
-            is_overlap = False
-            x1, y1, x2, y2 = detection['bounding_box']
+        Args:
+            gray_strip: Grayscale image containing the slots side by side
+            slot_count: Number of slots across the strip
+            threshold: Minimum confidence for a detection
+            scale: Pyramid scale to match at
+            early_exit_threshold: Confidence at which a slot stops trying templates
             
-            for existing in filtered:
-                ex1, ey1, ex2, ey2 = existing['bounding_box']
-                
-                # Calculate intersection over union (IoU)
-                intersection_area = max(0, min(x2, ex2) - max(x1, ex1)) * max(0, min(y2, ey2) - max(y1, ey1))
-                union_area = (x2 - x1) * (y2 - y1) + (ex2 - ex1) * (ey2 - ey1) - intersection_area
-                
-                if union_area > 0:
-                    iou = intersection_area / union_area
-                    if iou > overlap_threshold:
-                        is_overlap = True
-                        break
+        Returns:
+            Per slot, a (champion name, confidence) tuple or None
+        """
+        templates = self._get_scaled_templates(scale)
+        if not templates:
+            return [None] * slot_count
+        
+        if scale != 1.0:
+            gray_strip = cv2.resize(gray_strip, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        
+        slot_width = gray_strip.shape[1] // slot_count
+        search_image = self._to_search_image(gray_strip)
+        
+        best_names: List[Optional[str]] = [None] * slot_count
+        best_confidences = [-1.0] * slot_count
+        pending = set(range(slot_count))
+        
+        for name in sorted(templates, key=self._template_hits.__getitem__, reverse=True):
+            template = templates[name]['gray']
+            th, tw = template.shape[:2]
+            if tw > slot_width or th > gray_strip.shape[0]:
+                continue
             
-            if not is_overlap:
-                filtered.append(detection)
+            try:
+                result = cv2.matchTemplate(search_image, template, cv2.TM_CCOEFF_NORMED)
+                if isinstance(result, cv2.UMat):
+                    result = result.get()
+            except Exception as e:
+                logger.error(f"Error matching template for {name}: {e}")
+                continue
+            
+            # Columns where the template fits inside each slot, reduced to one max per slot
+            positions = slot_width - tw + 1
+            columns = (np.arange(slot_count)[:, None] * slot_width + np.arange(positions)).ravel()
+            slot_max = result[:, columns].reshape(result.shape[0], slot_count, positions).max(axis=(0, 2)).tolist()
+            
+            for i in list(pending):
+                if slot_max[i] > best_confidences[i]:
+                    best_names[i], best_confidences[i] = name, slot_max[i]
+                    if slot_max[i] >= early_exit_threshold:
+                        pending.discard(i)
+            
+            if not pending:
+                break
         
-        return filtered
+        matches: List[Optional[Tuple[str, float]]] = []
+        for name, confidence in zip(best_names, best_confidences):
+            if name is None or confidence < threshold:
+                matches.append(None)
+            else:
+                self._template_hits[name] += 1
+                matches.append((name, confidence))
+        return matches
+    
+    def _get_scaled_templates(self, scale: float) -> Dict[str, Dict[str, Any]]:
+        """Get template entries resized for a pyramid scale, cached per scale.
+        
+        Only 'gray' is resized; 'h' and 'w' stay at full resolution so
+        detections can be reported in original image coordinates.
+        """
+        self._ensure_templates()
+        if scale == 1.0:
+            return self.champion_templates
+        
+        scaled = self._scaled_templates.get(scale)
+        if scaled is None:
+            scaled = {
+                name: {
+                    **template,
+                    'gray': cv2.resize(template['gray'], None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+                }
+                for name, template in self.champion_templates.items()
+            }
+            self._scaled_templates[scale] = scaled
+        return scaled
+    
+    def _match_template(
+        self,
+        gray_image: np.ndarray,
+        champion_name: str,
+        template: Dict[str, Any],
+        threshold: float,
+        scale: float = 1.0
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Match a single grayscale template against a grayscale image.
+        
+        Args:
+            gray_image: Grayscale image to search (array or cv2.UMat)
+            champion_name: Name of the champion the template belongs to
+            template: Template entry with 'gray' (resized for scale) and full-resolution 'h'/'w'
+            threshold: Matching confidence threshold
+            scale: Scale the image and template were resized by
+            
+        Returns:
+            Tuple of (xs, ys, confidences) arrays for matches at full resolution
+        """
+        try:
+            # Perform template matching
+            result = cv2.matchTemplate(gray_image, template['gray'], cv2.TM_CCOEFF_NORMED)
+            if isinstance(result, cv2.UMat):
+                result = result.get()
+            ys, xs = np.where(result >= threshold)
+            confidences = result[ys, xs]
+            
+            if scale != 1.0:
+                xs = np.rint(xs / scale).astype(np.int64)
+                ys = np.rint(ys / scale).astype(np.int64)
+            
+            return xs, ys, confidences
+                
+        except Exception as e:
+            logger.error(f"Error matching template for {champion_name}: {e}")
+        
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
     
     def detect_champion_cost_by_color(self, champion_image: np.ndarray) -> Optional[int]:
         """Detect champion cost by analyzing border/background color.
@@ -137,37 +569,19 @@ class ChampionDetector:
             # Sample colors from the border area
             h, w = champion_image.shape[:2]
             
-            # Sample from top, bottom, left, right borders
-            border_pixels = []
+            # Average the top, bottom, left and right border strips
             border_thickness = max(1, min(h, w) // 10)
+            avg_color = _border_mean(champion_image, border_thickness)
             
-            # Top and bottom borders
-            border_pixels.extend(champion_image[:border_thickness, :].reshape(-1, 3))
-            border_pixels.extend(champion_image[-border_thickness:, :].reshape(-1, 3))
-            
-            # Left and right borders
-            border_pixels.extend(champion_image[:, :border_thickness].reshape(-1, 3))
-            border_pixels.extend(champion_image[:, -border_thickness:].reshape(-1, 3))
-            
-            border_pixels = np.array(border_pixels)
-            
-            # Find the most common color
-            avg_color = np.mean(border_pixels, axis=0)
-            
-            # Compare with known cost colors
-            best_match_cost = None
-            best_match_distance = float('inf')
-            
-            for cost, color_range in self.cost_colors.items():
-                for color in color_range:
-                    distance = np.linalg.norm(avg_color - np.array(color))
-                    if distance < best_match_distance:
-                        best_match_distance = distance
-                        best_match_cost = cost
+            # Squared distance to every palette color in one pass (the float mean
+            # promotes the difference, so squaring cannot overflow int16)
+            diff = self._cost_palette - avg_color
+            squared_distances = np.einsum('ij,ij->i', diff, diff)
+            best_index = int(np.argmin(squared_distances))
             
             # Only return if the match is reasonably confident
-            if best_match_distance < 100:  # Threshold for color similarity
-                return best_match_cost
+            if squared_distances[best_index] < 100 ** 2:  # Threshold for color similarity
+                return int(self._cost_labels[best_index])
             
         except Exception as e:
             logger.error(f"Error detecting champion cost by color: {e}")
@@ -185,26 +599,31 @@ class ChampionDetector:
             Detected text string
         """
         try:
-            import pytesseract
-            from PIL import Image
+            pytesseract, Image = self._get_ocr_modules()
             
             # Preprocess image for better OCR
             processed = self._preprocess_for_ocr(image, region_type)
             
-            # Convert to PIL Image
-            pil_image = Image.fromarray(cv2.cvtColor(processed, cv2.COLOR_BGR2RGB))
+            # Preprocessing yields single-channel output, which PIL takes directly as mode L
+            if processed.ndim == 2:
+                pil_image = Image.fromarray(processed)
+            else:
+                pil_image = Image.fromarray(cv2.cvtColor(processed, cv2.COLOR_BGR2RGB))
             
             # Configure OCR based on region type
-            if region_type in ['gold', 'level', 'health']:
-                # Numbers only
-                config = '--psm 7 -c tessedit_char_whitelist=0123456789'
-            elif region_type == 'round':
-                # Numbers and dash for rounds like "2-1"
-                config = '--psm 7 -c tessedit_char_whitelist=0123456789-'
-            else:
-                # General text
-                config = '--psm 6'
+            psm, whitelist = _ocr_mode(region_type)
+            
+            # Prefer the in-process API; pytesseract spawns a tesseract process per call
+            api = self._get_tess_api()
+            if api is not None:
+                api.SetPageSegMode(psm)
+                api.SetVariable('tessedit_char_whitelist', whitelist)
+                api.SetImage(pil_image)
+                return api.GetUTF8Text().strip()
             
+            config = f'--psm {psm}'
+            if whitelist:
+                config += f' -c tessedit_char_whitelist={whitelist}'
             text = pytesseract.image_to_string(pil_image, config=config)
             return text.strip()
             
@@ -212,8 +631,137 @@ class ChampionDetector:
             logger.error(f"Error detecting text in {region_type} region: {e}")
             return ""
     
+    def detect_text_in_strip(self, images: List[np.ndarray], region_types: List[str]) -> Optional[List[Optional[str]]]:
+        """Detect text in several single-line regions with one OCR pass.
+        
+        Every region is scaled to the same height and binarized the same way,
+        then the regions are stacked vertically with blank separator bands.
+        Recognized words are assigned back to regions by which row they sit in.
+        
+        Args:
+            images: Input images, one per region
+            region_types: Region type for each image (gold, level, etc.)
+            
+        Returns:
+            Detected text per region (None for a region where nothing was
+            read), or None if the strip OCR failed
+        """
+        try:
+            pytesseract, Image = self._get_ocr_modules()
+            
+            row_height = _STRIP_ROW_HEIGHT
+            processed = []
+            for image in images:
+                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+                scale = row_height / gray.shape[0]
+                interpolation = cv2.INTER_CUBIC if scale > 1.0 else cv2.INTER_AREA
+                width = max(1, round(gray.shape[1] * scale))
+                processed.append(_binarize_for_ocr(cv2.resize(gray, (width, row_height), interpolation=interpolation)))
+            
+            # Pad every region to a common width on a white background (black text on white)
+            width = max(region.shape[1] for region in processed)
+            gap = row_height // 2
+            rows = []
+            for region in processed:
+                rows.append(cv2.copyMakeBorder(region, gap, 0, 0, width - region.shape[1], cv2.BORDER_CONSTANT, value=255))
+            rows.append(np.full((gap, width), 255, dtype=np.uint8))
+            pil_image = Image.fromarray(np.vstack(rows))
+            
+            # Single block of text, limited to the union of the regions' whitelists
+            whitelists = [_ocr_mode(region_type)[1] for region_type in region_types]
+            whitelist = '' if '' in whitelists else ''.join(sorted(set(''.join(whitelists))))
+            
+            # Collect (word, vertical center) pairs in reading order
+            words = []
+            api = self._get_tess_api()
+            if api is not None:
+                api.SetPageSegMode(6)
+                api.SetVariable('tessedit_char_whitelist', whitelist)
+                api.SetImage(pil_image)
+                api.Recognize()
+                level = self._tesserocr.RIL.WORD
+                for word in self._tesserocr.iterate_level(api.GetIterator(), level):
+                    box = word.BoundingBox(level)
+                    if box is not None:
+                        words.append((word.GetUTF8Text(level), (box[1] + box[3]) / 2))
+            else:
+                config = '--psm 6'
+                if whitelist:
+                    config += f' -c tessedit_char_whitelist={whitelist}'
+                data = pytesseract.image_to_data(pil_image, config=config, output_type=pytesseract.Output.DICT)
+                for text, top, height in zip(data['text'], data['top'], data['height']):
+                    words.append((text, top + height / 2))
+            
+            # Row i spans [gap + i * (row_height + gap), gap + i * (row_height + gap) + row_height)
+            texts = [[] for _ in images]
+            for text, center in words:
+                text = (text or '').strip()
+                row = int((center - gap / 2) // (row_height + gap))
+                if text and 0 <= row < len(texts):
+                    texts[row].append(text)
+            
+            missing = sum(1 for row_words in texts if not row_words)
+            if missing:
+                logger.debug(f"Strip OCR read nothing for {missing} of {len(images)} regions")
+            return [' '.join(row_words) if row_words else None for row_words in texts]
+            
+        except Exception as e:
+            logger.error(f"Error detecting text in region strip: {e}")
+            return None
+    
+    def _get_ocr_modules(self) -> Tuple[Any, Any]:
+        """Import pytesseract and PIL.Image on first use and cache them.
+        
+        Returns:
+            Tuple of (pytesseract module, PIL.Image module)
+        """
+        if self._tesseract is None:
+            import pytesseract
+            from PIL import Image
+            self._tesseract = pytesseract
+            self._pil_image = Image
+        return self._tesseract, self._pil_image
+    
+    def _get_tess_api(self):
+        """Get this thread's persistent tesserocr API, creating it on first use.
+        
+        Returns:
+            tesserocr.PyTessBaseAPI, or None if tesserocr is not installed
+        """
+        if self._tesserocr is None:
+            try:
+                import tesserocr
+                self._tesserocr = tesserocr
+            except ImportError:
+                logger.info("tesserocr not installed, falling back to pytesseract")
+                self._tesserocr = False
+        
+        if not self._tesserocr:
+            return None
+        
+        api = getattr(self._tess_local, 'api', None)
+        if api is None:
+            api = self._tesserocr.PyTessBaseAPI(psm=self._tesserocr.PSM.SINGLE_LINE)
+            self._tess_local.api = api
+        return api
+    
+    def _get_clahe(self):
+        """Get this thread's CLAHE instance, creating it on first use.
+        
+        CLAHE objects keep internal scratch buffers, so they are not shared
+        between threads.
+        """
+        clahe = getattr(self._tess_local, 'clahe', None)
+        if clahe is None:
+            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
+            self._tess_local.clahe = clahe
+        return clahe
+    
     def _preprocess_for_ocr(self, image: np.ndarray, region_type: str) -> np.ndarray:
-        """Preprocess image for better OCR results."""
+        """Preprocess image for better OCR results.
+        
+        Returns a single-channel image (or the input unchanged on failure).
+        """
         if image is None:
             return image
         
@@ -226,38 +774,40 @@ class ChampionDetector:
             
             # Apply different preprocessing based on region type
             if region_type in ['gold', 'level', 'health']:
-                # For numeric regions: threshold to get white text on black background
-                _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-                
-                # Invert if needed (OCR works better with black text on white)
-                if np.mean(binary) < 127:
-                    binary = cv2.bitwise_not(binary)
+                # For numeric regions: binarize to black text on white
+                binary = _binarize_for_ocr(gray)
                 
                 # Scale up for better recognition
                 scale_factor = 3
                 scaled = cv2.resize(binary, None, fx=scale_factor, fy=scale_factor, interpolation=cv2.INTER_CUBIC)
                 
-                return cv2.cvtColor(scaled, cv2.COLOR_GRAY2BGR)
+                return scaled
             
             else:
                 # For general text: denoise and enhance contrast
                 denoised = cv2.medianBlur(gray, 3)
                 
                 # Enhance contrast
-                clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
-                enhanced = clahe.apply(denoised)
+                enhanced = self._get_clahe().apply(denoised)
                 
-                return cv2.cvtColor(enhanced, cv2.COLOR_GRAY2BGR)
+                return enhanced
                 
         except Exception as e:
             logger.error(f"Error preprocessing image for OCR: {e}")
             return image
     
-    def analyze_shop_slots(self, shop_image: np.ndarray) -> List[Dict[str, Any]]:
+    def analyze_shop_slots(
+        self,
+        shop_image: np.ndarray,
+        scale: float = 1.0,
+        gray_image: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
         """Analyze individual shop slots for champions and costs.
         
         Args:
             shop_image: Image of the shop area
+            scale: Pyramid scale for template matching (1.0 matches at full resolution)
+            gray_image: Grayscale version of shop_image, if the caller already has one
             
         Returns:
             List of shop slot analyses
@@ -273,6 +823,14 @@ class ChampionDetector:
             shop_width = shop_image.shape[1]
             slot_width = shop_width // slot_count
             
+            self._ensure_templates()
+            if not self.champion_templates:
+                logger.warning("No champion templates loaded")
+            
+            # Convert once; every template is matched against the whole strip
+            gray_shop = gray_image if gray_image is not None else cv2.cvtColor(shop_image, cv2.COLOR_BGR2GRAY)
+            best_matches = self._detect_best_per_slot(gray_shop, slot_count, threshold=0.7, scale=scale)
+            
             for i in range(slot_count):
                 # Extract individual slot
                 x_start = i * slot_width
@@ -290,13 +848,8 @@ class ChampionDetector:
                     'confidence': 0.0
                 }
                 
-                # Try template matching on this slot
-                detections = self.detect_champion_by_template(slot_image, threshold=0.7)
-                
-                if detections:
-                    best_detection = detections[0]  # Highest confidence
-                    slot_analysis['champion_name'] = best_detection['name']
-                    slot_analysis['confidence'] = best_detection['confidence']
+                if best_matches[i] is not None:
+                    slot_analysis['champion_name'], slot_analysis['confidence'] = best_matches[i]
                 
                 # Try to detect cost by color
                 cost = self.detect_champion_cost_by_color(slot_image)
@@ -310,6 +863,69 @@ class ChampionDetector:
         
         return slots
     
+    def _build_champ_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load champion data into a dict keyed by lowercased name.
+        
+        Returns:
+            Mapping of lowercased champion name to champion data (empty if unavailable)
+        """
+        try:
+            self._champ_index_mtime = self._champs_path.stat().st_mtime
+        except OSError:
+            self._champ_index_mtime = None
+            return {}
+        
+        try:
+            with open(self._champs_path, 'rb') as f:
+                champions_data = orjson.loads(f.read())
+        except Exception as e:
+            logger.error(f"Error loading champion data from {self._champs_path}: {e}")
+            return {}
+        
+        if not isinstance(champions_data, list):
+            logger.error(f"Champion data in {self._champs_path} is not a list")
+            return {}
+        
+        index = {}
+        skipped = 0
+        for champ in champions_data:
+            # A malformed entry must not take down the detector, so skip it
+            if not isinstance(champ, dict) or not isinstance(champ.get('name'), str):
+                skipped += 1
+                continue
+            # Keep the first entry for a name, as the old linear scan did
+            index.setdefault(champ['name'].lower(), champ)
+        
+        if skipped:
+            logger.warning(f"Skipped {skipped} malformed champion entries in {self._champs_path}")
+        return index
+    
+    @staticmethod
+    def _build_cost_traits_index(index: Dict[str, Dict[str, Any]]) -> Dict[str, Tuple[Any, Tuple[str, ...]]]:
+        """Precompute (cost, traits) pairs from the champion index.
+        
+        Args:
+            index: Mapping of lowercased champion name to champion data
+            
+        Returns:
+            Mapping of lowercased champion name to (cost, traits tuple)
+        """
+        return {
+            name: (champ.get('cost', 0), tuple(t for t in champ.get('traits') or () if isinstance(t, str)))
+            for name, champ in index.items()
+        }
+    
+    def _refresh_champ_index(self) -> None:
+        """Rebuild the champion index if the data file changed on disk."""
+        try:
+            mtime = self._champs_path.stat().st_mtime
+        except OSError:
+            mtime = None
+        
+        if mtime != self._champ_index_mtime:
+            self._champ_index = self._build_champ_index()
+            self._champ_cost_traits = self._build_cost_traits_index(self._champ_index)
+    
     def get_champion_info(self, champion_name: str) -> Dict[str, Any]:
         """Get stored information about a champion.
         
@@ -320,18 +936,32 @@ class ChampionDetector:
             Champion information dictionary
         """
         try:
-            # Load champion data
-            champs_path = Path("data/champions.json")
-            if champs_path.exists():
-                with open(champs_path, 'r') as f:
-                    champions_data = json.load(f)
-                
-                # Find matching champion (case-insensitive)
-                for champ in champions_data:
-                    if champ.get('name', '').lower() == champion_name.lower():
-                        return champ
+            self._refresh_champ_index()
+            champ = self._champ_index.get(champion_name.lower())
+            if champ is not None:
+                return champ
             
         except Exception as e:
             logger.error(f"Error getting champion info for {champion_name}: {e}")
         
-        return {'name': champion_name, 'cost': 'unknown', 'traits': []}
\ No newline at end of file
+        return {'name': champion_name, 'cost': 'unknown', 'traits': []}
+    
+    def get_champion_cost_traits(self, champion_name: str) -> Tuple[Any, Tuple[str, ...]]:
+        """Get a champion's cost and traits without copying its full record.
+        
+        Args:
+            champion_name: Name of the champion
+            
+        Returns:
+            (cost, traits) tuple; ('unknown', ()) for champions not in the data
+        """
+        try:
+            self._refresh_champ_index()
+            cost_traits = self._champ_cost_traits.get(champion_name.lower())
+            if cost_traits is not None:
+                return cost_traits
+            
+        except Exception as e:
+            logger.error(f"Error getting champion cost/traits for {champion_name}: {e}")
+        
+        return ('unknown', ())
@@ -1,25 +1,156 @@
 import cv2
 import numpy as np
-import pyautogui
+import mss
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 import json
+import re
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import orjson
 
 from assistant.gemini_service import get_global_client
 from config.settings import get_ocr_settings
+from vision.async_writer import AsyncFileWriter
 from vision.champion_detector import ChampionDetector
 
 logger = logging.getLogger(__name__)
 
+# Patterns for parsing OCR'd stat text, compiled once at import
+_DIGIT_RE = re.compile(r'(\d+)')
+_ROUND_RE = re.compile(r'(\d+-\d+)')
+
+def _prepare_for_ocr(img: np.ndarray, target_h: Optional[int]) -> np.ndarray:
+    """Downscale an OCR region captured above its logical size back to it.
+    
+    HiDPI and 4K captures make glyphs far taller than Tesseract needs, and it
+    is cheaper to shrink them once here than inside Tesseract. Captures at
+    the logical size (a normal 1x display) are passed through untouched, so
+    the common path pays for no resample.
+    
+    Args:
+        img: OpenCV image of the region
+        target_h: Logical height of the region in pixels, or None if unknown
+        
+    Returns:
+        Downscaled image, or the input unchanged if it is not larger than target_h
+    """
+    if target_h is None or img.shape[0] <= target_h:
+        return img
+    scale = target_h / img.shape[0]
+    return cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+def _parse_stats(texts: Dict[str, str]) -> Dict[str, Any]:
+    """Parse OCR'd stat text into numbers and the round stage.
+    
+    Args:
+        texts: Mapping of region name (gold, level, health, round) to OCR text
+        
+    Returns:
+        Dictionary with whichever of gold, level, health and round_stage parsed
+    """
+    stats = {}
+    
+    # Extract and parse gold, level and health (e.g. "50" from "Gold: 50")
+    for stat in ('gold', 'level', 'health'):
+        if stat in texts:
+            stat_match = _DIGIT_RE.search(texts[stat])
+            if stat_match:
+                stats[stat] = int(stat_match.group(1))
+                logger.debug(f"Detected {stat}: {stats[stat]}")
+    
+    # Extract round/stage
+    if 'round' in texts:
+        # Look for patterns like "4-2" or "Round 4-2"
+        round_match = _ROUND_RE.search(texts['round'])
+        if round_match:
+            stats['round_stage'] = round_match.group(1)
+            logger.debug(f"Detected round: {stats['round_stage']}")
+    
+    return stats
+
+@dataclass
+class GameStateRecord:
+    """Flat snapshot of one analyzed frame, with stats already parsed."""
+    timestamp: int
+    analysis_duration: float = 0.0
+    gold: Optional[int] = None
+    level: Optional[int] = None
+    health: Optional[int] = None
+    round_stage: Optional[str] = None
+    champion_count: int = 0
+    total_cost: int = 0
+    traits_active: Dict[str, int] = field(default_factory=dict)
+    board_champions: List[str] = field(default_factory=list)
+    shop_champions: List[str] = field(default_factory=list)
+    shop_total_cost: int = 0
+    shop_screenshot_path: Optional[str] = None
+    error: Optional[str] = None
+    
+    def to_json(self) -> str:
+        """Serialize the record to a JSON string."""
+        return orjson.dumps(asdict(self)).decode()
+
+# Unchanged-region reuse: a region counts as unchanged when no cell of its
+# quarter-scale gray thumbnail moved by more than the tolerance, and a reused
+# analysis is refreshed once it is older than the max age regardless
+_THUMBNAIL_SCALE = 0.25
+_THUMBNAIL_TOLERANCE = 6
+_REUSE_MAX_AGE = 5.0
+
+def _region_thumbnail(image: np.ndarray) -> np.ndarray:
+    """Downsample a region to a small grayscale thumbnail for change detection.
+    
+    Args:
+        image: OpenCV image of the region (BGR or grayscale)
+        
+    Returns:
+        Quarter-scale grayscale thumbnail
+    """
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+    return cv2.resize(gray, None, fx=_THUMBNAIL_SCALE, fy=_THUMBNAIL_SCALE, interpolation=cv2.INTER_AREA)
+
+def _thumbnails_match(a: Optional[np.ndarray], b: np.ndarray) -> bool:
+    """Check whether two region thumbnails are equal within the tolerance."""
+    return a is not None and a.shape == b.shape and int(cv2.absdiff(a, b).max()) <= _THUMBNAIL_TOLERANCE
+
 class TFTGameStateAnalyzer:
     """Analyzes TFT game state from screen captures."""
     
     def __init__(self):
         self.ocr_settings = get_ocr_settings()
-        self.gemini_client = get_global_client()
-        self.champion_detector = ChampionDetector()
+        # Heavy collaborators are created on first use, so the stats-only path stays cheap
+        self._gemini_client = None
+        self._champion_detector: Optional[ChampionDetector] = None
+        self._lazy_lock = threading.Lock()
+        # Template matching runs through OpenCL only when enabled in settings and a device is available
+        self._use_umat = self.ocr_settings.use_opencl and cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+        # Screen grabbers, opened on first capture and reused; mss handles are
+        # not shareable across threads, so each capturing thread gets its own
+        self._sct_local = threading.local()
+        self._scts: List[Any] = []
+        # Board/shop matching and OCR are independent and release the GIL, so run them side by side
+        # (pool is created on the first full analysis, so stats-only callers never start it)
+        self._pool_executor: Optional[ThreadPoolExecutor] = None
+        
+        # Debug screenshots are off the hot path unless explicitly enabled; the
+        # directory is created once here, and only when it will be written to
+        self.debug_screenshots = self.ocr_settings.debug_screenshots
+        self._screenshot_dir = Path("screenshots")
+        if self.debug_screenshots:
+            self._screenshot_dir.mkdir(exist_ok=True)
+        # Background writer, started on the first debug screenshot
+        self._writer: Optional[AsyncFileWriter] = None
+        self._shop_slot_boxes: Dict[Tuple[int, int], np.ndarray] = {}
+        
+        # Last thumbnail, analysis and analysis time per region, to skip unchanged board/shop frames
+        self._prev_thumbnails: Dict[str, np.ndarray] = {}
+        self._prev_analysis: Dict[str, Dict[str, Any]] = {}
+        self._prev_analyzed_at: Dict[str, float] = {}
         
         # Screen regions for different game elements (you'll need to calibrate these)
         self.regions = {
@@ -31,6 +162,87 @@ class TFTGameStateAnalyzer:
             'round': (600, 50, 200, 50),         # Round counter
             'bench': (330, 850, 1250, 190),     # Bench area
         }
+        
+        # Precompute the single capture box covering every region, and each
+        # region's slices into that capture
+        left = min(x for x, _, _, _ in self.regions.values())
+        top = min(y for _, y, _, _ in self.regions.values())
+        right = max(x + w for x, _, w, _ in self.regions.values())
+        bottom = max(y + h for _, y, _, h in self.regions.values())
+        self._capture_bbox = {'left': left, 'top': top, 'width': right - left, 'height': bottom - top}
+        self._region_slices: Dict[str, Tuple[slice, slice]] = {
+            name: (slice(y - top, y - top + h), slice(x - left, x - left + w))
+            for name, (x, y, w, h) in self.regions.items()
+        }
+        self._scaled_region_slices: Dict[Tuple[int, int], Dict[str, Tuple[slice, slice]]] = {}
+    
+    @property
+    def champion_detector(self) -> ChampionDetector:
+        """Champion detector, created on first use."""
+        if self._champion_detector is None:
+            with self._lazy_lock:
+                if self._champion_detector is None:
+                    self._champion_detector = ChampionDetector(use_opencl=self._use_umat)
+        return self._champion_detector
+    
+    @property
+    def gemini_client(self):
+        """Gemini client, fetched on first use."""
+        if self._gemini_client is None:
+            with self._lazy_lock:
+                if self._gemini_client is None:
+                    self._gemini_client = get_global_client()
+        return self._gemini_client
+    
+    @property
+    def _pool(self) -> ThreadPoolExecutor:
+        """Region analysis pool, created on first use."""
+        if self._pool_executor is None:
+            with self._lazy_lock:
+                if self._pool_executor is None:
+                    self._pool_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="game-analyzer")
+        return self._pool_executor
+    
+    def _get_sct(self):
+        """Get this thread's screen grabber, opening it on first use."""
+        sct = getattr(self._sct_local, 'sct', None)
+        if sct is None:
+            sct = mss.mss()
+            self._sct_local.sct = sct
+            with self._lazy_lock:
+                self._scts.append(sct)
+        return sct
+    
+    def close(self) -> None:
+        """Flush pending debug screenshots, stop background threads and release grabbers."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        
+        if self._pool_executor is not None:
+            self._pool_executor.shutdown(wait=True)
+            self._pool_executor = None
+        
+        # Recreated on next use, like the pool above
+        with self._lazy_lock:
+            detector, self._champion_detector = self._champion_detector, None
+        if detector is not None:
+            detector.close()
+        
+        with self._lazy_lock:
+            scts, self._scts = self._scts, []
+            self._sct_local = threading.local()
+        for sct in scts:
+            try:
+                sct.close()
+            except Exception as e:
+                logger.debug(f"Error closing screen grabber: {e}")
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
     
     def capture_screen_region(self, region: Tuple[int, int, int, int]) -> np.ndarray:
         """Capture a specific region of the screen.
@@ -42,10 +254,12 @@ class TFTGameStateAnalyzer:
             OpenCV image array
         """
         try:
-            screenshot = pyautogui.screenshot(region=region)
-            # Convert PIL to OpenCV format
-            cv_image = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
-            return cv_image
+            x, y, w, h = region
+            raw = self._get_sct().grab({'left': x, 'top': y, 'width': w, 'height': h})
+            # mss returns BGRA, so dropping alpha gives OpenCV's BGR layout without a color conversion;
+            # raw.raw is the grab's own buffer (raw.bgra would copy it into bytes first)
+            bgra = np.frombuffer(raw.raw, dtype=np.uint8).reshape(raw.height, raw.width, 4)
+            return bgra[:, :, :3]
         except Exception as e:
             logger.error(f"Error capturing screen region {region}: {e}")
             return None
@@ -58,21 +272,65 @@ class TFTGameStateAnalyzer:
         """
         captures = {}
         
-        for region_name, region_coords in self.regions.items():
-            image = self.capture_screen_region(region_coords)
-            if image is not None:
-                captures[region_name] = image
-                logger.debug(f"Captured {region_name}: {image.shape}")
-            else:
-                logger.warning(f"Failed to capture {region_name}")
+        # One grab covering every region; each region is then a zero-copy view
+        try:
+            raw = self._get_sct().grab(self._capture_bbox)
+        except Exception as e:
+            logger.error(f"Error capturing game regions: {e}")
+            return captures
+        
+        full = np.frombuffer(raw.raw, dtype=np.uint8).reshape(raw.height, raw.width, 4)
+        
+        for region_name, (ys, xs) in self._get_region_slices(raw.width, raw.height).items():
+            image = full[ys, xs, :3]
+            captures[region_name] = image
+            logger.debug(f"Captured {region_name}: {image.shape}")
         
         return captures
     
-    def analyze_board_state(self, board_image: np.ndarray) -> Dict[str, Any]:
+    def _get_region_slices(self, width: int, height: int) -> Dict[str, Tuple[slice, slice]]:
+        """Get region slices for a capture of the given pixel size.
+        
+        HiDPI displays grab at physical resolution, so logical region
+        coordinates are scaled onto the buffer (cached per capture size).
+        
+        Args:
+            width: Captured image width in pixels
+            height: Captured image height in pixels
+            
+        Returns:
+            Mapping of region name to (row slice, column slice)
+        """
+        if width == self._capture_bbox['width'] and height == self._capture_bbox['height']:
+            return self._region_slices
+        
+        slices = self._scaled_region_slices.get((width, height))
+        if slices is None:
+            scale_x = width / self._capture_bbox['width']
+            scale_y = height / self._capture_bbox['height']
+            slices = {
+                name: (
+                    slice(round(ys.start * scale_y), round(ys.stop * scale_y)),
+                    slice(round(xs.start * scale_x), round(xs.stop * scale_x))
+                )
+                for name, (ys, xs) in self._region_slices.items()
+            }
+            self._scaled_region_slices[(width, height)] = slices
+        return slices
+    
+    def analyze_board_state(
+        self,
+        board_image: np.ndarray,
+        board_gray: Optional[np.ndarray] = None,
+        detailed: bool = True
+    ) -> Dict[str, Any]:
         """Analyze the main board for champions and positions.
         
         Args:
             board_image: OpenCV image of the board
+            board_gray: Grayscale version of board_image, if already computed
+            detailed: Build a per-champion dict with position, confidence, cost
+                and traits; when False only "champion_names" is filled in
             
         Returns:
             Dictionary containing board analysis
@@ -84,56 +342,66 @@ class TFTGameStateAnalyzer:
             "champions": [],
             "champion_count": 0,
             "total_cost": 0,
-            "traits_active": [],
+            "traits_active": {},
             "positioning": "unknown"
         }
         
         try:
-            # Use template matching to detect specific champions
-            detections = self.champion_detector.detect_champion_by_template(board_image, threshold=0.7)
+            # Use template matching to detect specific champions; matching at half
+            # scale is ~4x cheaper, and positions come back at full resolution
+            detections = self.champion_detector.detect_champion_arrays(
+                board_gray if board_gray is not None else board_image, threshold=0.68, scale=0.5
+            )
+            names = detections['names']
+            
+            # Look up each distinct champion once and weight it by how often it appears
+            unique_names, name_idx, name_counts = np.unique(
+                np.array(names, dtype=object), return_inverse=True, return_counts=True
+            )
+            unique_info = [self.champion_detector.get_champion_cost_traits(name) for name in unique_names]
             
             champions_info = []
-            total_cost = 0
+            if detailed:
+                for name, (x, y), confidence, idx in zip(
+                    names,
+                    detections['positions'].tolist(),
+                    detections['confidences'].tolist(),
+                    name_idx.tolist()
+                ):
+                    cost, traits = unique_info[idx]
+                    champions_info.append({
+                        'name': name,
+                        'position': (x, y),
+                        'confidence': confidence,
+                        'cost': cost,
+                        'traits': list(traits)
+                    })
+            else:
+                board_analysis["champion_names"] = names
             
-            for detection in detections:
-                champ_name = detection['name']
-                champ_info = self.champion_detector.get_champion_info(champ_name)
-                
-                champion_data = {
-                    'name': champ_name,
-                    'position': detection['position'],
-                    'confidence': detection['confidence'],
-                    'cost': champ_info.get('cost', 0),
-                    'traits': champ_info.get('traits', [])
-                }
-                
-                champions_info.append(champion_data)
-                
-                # Add to total cost if it's a number
-                if isinstance(champ_info.get('cost'), int):
-                    total_cost += champ_info['cost']
+            # Add to total cost where the cost is a number
+            total_cost = 0
+            trait_counts = {}
+            for (cost, traits), count in zip(unique_info, name_counts.tolist()):
+                if isinstance(cost, int):
+                    total_cost += cost * count
+                for trait in traits:
+                    trait_counts[trait] = trait_counts.get(trait, 0) + count
             
             board_analysis["champions"] = champions_info
-            board_analysis["champion_count"] = len(champions_info)
+            board_analysis["champion_count"] = len(names)
             board_analysis["total_cost"] = total_cost
             
-            # Calculate active traits
-            trait_counts = {}
-            for champ in champions_info:
-                for trait in champ.get('traits', []):
-                    trait_counts[trait] = trait_counts.get(trait, 0) + 1
-            
             # Filter for meaningful trait counts (2+)
             active_traits = {trait: count for trait, count in trait_counts.items() if count >= 2}
             board_analysis["traits_active"] = active_traits
             
             # Save board screenshot for debugging
-            timestamp = int(time.time())
-            board_path = Path("screenshots") / f"board_{timestamp}.png"
-            board_path.parent.mkdir(exist_ok=True)
-            cv2.imwrite(str(board_path), board_image)
+            if self.debug_screenshots:
+                board_path = self._screenshot_dir / f"board_{int(time.time())}.jpg"
+                self._save_screenshot(board_path, board_image.copy())
             
-            logger.info(f"Board analysis: {len(champions_info)} champions, {total_cost} total cost, traits: {active_traits}")
+            logger.info(f"Board analysis: {len(names)} champions, {total_cost} total cost, traits: {active_traits}")
             
         except Exception as e:
             logger.error(f"Error analyzing board state: {e}")
@@ -141,11 +409,19 @@ class TFTGameStateAnalyzer:
         
         return board_analysis
     
-    def analyze_shop_state(self, shop_image: np.ndarray) -> Dict[str, Any]:
+    def analyze_shop_state(
+        self,
+        shop_image: np.ndarray,
+        shop_gray: Optional[np.ndarray] = None,
+        detailed: bool = True
+    ) -> Dict[str, Any]:
         """Analyze the shop for available champions.
         
         Args:
             shop_image: OpenCV image of the shop
+            shop_gray: Grayscale version of shop_image, if already computed
+            detailed: Build a dict per available champion; when False only
+                "champion_names" is filled in
             
         Returns:
             Dictionary containing shop analysis
@@ -163,9 +439,10 @@ class TFTGameStateAnalyzer:
         
         try:
             # Analyze individual shop slots
-            slots = self.champion_detector.analyze_shop_slots(shop_image)
+            slots = self.champion_detector.analyze_shop_slots(shop_image, gray_image=shop_gray)
             
             available_champions = []
+            champion_names = []
             total_cost = 0
             costs_distribution = {}
             
@@ -174,12 +451,14 @@ class TFTGameStateAnalyzer:
                     champ_name = slot['champion_name']
                     champ_cost = slot.get('cost')
                     
-                    available_champions.append({
-                        'name': champ_name,
-                        'cost': champ_cost,
-                        'slot': slot['slot_index'],
-                        'confidence': slot.get('confidence', 0)
-                    })
+                    champion_names.append(champ_name)
+                    if detailed:
+                        available_champions.append({
+                            'name': champ_name,
+                            'cost': champ_cost,
+                            'slot': slot['slot_index'],
+                            'confidence': slot.get('confidence', 0)
+                        })
                     
                     if champ_cost:
                         total_cost += champ_cost
@@ -187,35 +466,31 @@ class TFTGameStateAnalyzer:
             
             shop_analysis["shop_slots"] = slots
             shop_analysis["available_champions"] = available_champions
+            if not detailed:
+                shop_analysis["champion_names"] = champion_names
             shop_analysis["total_cost"] = total_cost
             shop_analysis["costs_distribution"] = costs_distribution
             
             # Save shop screenshot with analysis
-            timestamp = int(time.time())
-            shop_path = Path("screenshots") / f"shop_{timestamp}.png"
-            shop_path.parent.mkdir(exist_ok=True)
-            
-            # Draw detection boxes on the image for debugging
-            debug_image = shop_image.copy()
-            slot_width = shop_image.shape[1] // 5
-            
-            for i, slot in enumerate(slots):
-                x = i * slot_width
-                y = 0
-                w = slot_width
-                h = shop_image.shape[0]
+            if self.debug_screenshots:
+                shop_path = self._screenshot_dir / f"shop_{int(time.time())}.jpg"
+                
+                # Draw detection boxes on the image for debugging
+                debug_image = shop_image.copy()
+                slot_width = shop_image.shape[1] // 5
                 
-                # Draw slot boundaries
-                cv2.rectangle(debug_image, (x, y), (x + w, y + h), (0, 255, 0), 2)
+                # Draw all slot boundaries in one call
+                cv2.polylines(debug_image, self._get_shop_slot_boxes(shop_image.shape[:2]), True, (0, 255, 0), 2)
                 
                 # Add text labels
-                label = f"{slot.get('champion_name', 'unknown')} ({slot.get('cost', '?')})"
-                cv2.putText(debug_image, label, (x + 5, y + 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-            
-            cv2.imwrite(str(shop_path), debug_image)
-            shop_analysis["screenshot_path"] = str(shop_path)
+                labels = [f"{slot.get('champion_name', 'unknown')} ({slot.get('cost', '?')})" for slot in slots]
+                for i, label in enumerate(labels):
+                    cv2.putText(debug_image, label, (i * slot_width + 5, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+                
+                if self._save_screenshot(shop_path, debug_image):
+                    shop_analysis["screenshot_path"] = str(shop_path)
             
-            logger.info(f"Shop analysis: {len(available_champions)} champions detected, total cost: {total_cost}")
+            logger.info(f"Shop analysis: {len(champion_names)} champions detected, total cost: {total_cost}")
             
         except Exception as e:
             logger.error(f"Error analyzing shop state: {e}")
@@ -223,11 +498,54 @@ class TFTGameStateAnalyzer:
         
         return shop_analysis
     
+    def _get_shop_slot_boxes(self, shape: Tuple[int, int]) -> np.ndarray:
+        """Get the five shop slot outlines as polylines, cached by image shape.
+        
+        Args:
+            shape: (height, width) of the shop image
+            
+        Returns:
+            int32 array of shape (5, 4, 1, 2) holding each slot's corners
+        """
+        boxes = self._shop_slot_boxes.get(shape)
+        if boxes is None:
+            h, width = shape
+            slot_width = width // 5
+            boxes = np.array([
+                [[x, 0], [x + slot_width, 0], [x + slot_width, h], [x, h]]
+                for x in range(0, 5 * slot_width, slot_width)
+            ], dtype=np.int32).reshape(5, 4, 1, 2)
+            self._shop_slot_boxes[shape] = boxes
+        return boxes
+    
+    def _save_screenshot(self, path: Path, image: np.ndarray) -> bool:
+        """Queue a debug screenshot to be JPEG-encoded and written in the background.
+        
+        The writer queue is bounded; if it is full the screenshot is dropped
+        rather than stalling analysis.
+        
+        Args:
+            path: Destination file path
+            image: OpenCV image to save; must not be modified afterwards
+            
+        Returns:
+            True if the screenshot was queued
+        """
+        if self._writer is None:
+            with self._lazy_lock:
+                if self._writer is None:
+                    self._writer = AsyncFileWriter()
+        
+        if not self._writer.submit_image(path, image, [cv2.IMWRITE_JPEG_QUALITY, 70]):
+            logger.debug(f"Skipped screenshot {path}, writer busy")
+            return False
+        return True
+    
     def extract_game_text(self, image: np.ndarray, region_name: str) -> str:
         """Extract text from image using OCR.
         
         Args:
-            image: OpenCV image
+            image: OpenCV image (BGR or grayscale)
             region_name: Name of the region for logging
             
         Returns:
@@ -235,7 +553,8 @@ class TFTGameStateAnalyzer:
         """
         try:
             # Use the champion detector's OCR method for consistency
-            text = self.champion_detector.detect_text_in_region(image, region_name)
+            logical_h = self.regions[region_name][3] if region_name in self.regions else None
+            text = self.champion_detector.detect_text_in_region(_prepare_for_ocr(image, logical_h), region_name)
             
             logger.debug(f"Extracted text from {region_name}: '{text}'")
             return text
@@ -253,57 +572,190 @@ class TFTGameStateAnalyzer:
         start_time = time.time()
         logger.info("Starting complete game state analysis")
         
+        frame = self._analyze_frame()
+        if frame is None:
+            return {"error": "Failed to capture screen"}
+        timestamp, board, shop, resources, game_info = frame
+        
+        analysis = {
+            "timestamp": timestamp,
+            "analysis_duration": time.time() - start_time,
+            "board": board,
+            "shop": shop,
+            "resources": resources,
+            "game_info": game_info
+        }
+        logger.info(f"Game state analysis completed in {analysis['analysis_duration']:.2f}s")
+        
+        return analysis
+    
+    def analyze_game_state_record(self) -> GameStateRecord:
+        """Capture and analyze the complete game state as a flat record.
+        
+        Same analysis as analyze_complete_game_state, but with the stats
+        already parsed, and the board and shop analyzed without building a
+        dict per champion.
+        
+        Returns:
+            GameStateRecord for the current frame
+        """
+        start_time = time.time()
+        logger.info("Starting complete game state analysis")
+        
+        frame = self._analyze_frame(detailed=False)
+        if frame is None:
+            return GameStateRecord(timestamp=int(time.time()), error="Failed to capture screen")
+        timestamp, board, shop, resources, game_info = frame
+        
+        stats = _parse_stats({**resources, **game_info})
+        record = GameStateRecord(
+            timestamp=timestamp,
+            analysis_duration=time.time() - start_time,
+            gold=stats.get('gold'),
+            level=stats.get('level'),
+            health=stats.get('health'),
+            round_stage=stats.get('round_stage'),
+            champion_count=board.get('champion_count', 0),
+            total_cost=board.get('total_cost', 0),
+            traits_active=board.get('traits_active', {}),
+            board_champions=board.get('champion_names', []),
+            shop_champions=shop.get('champion_names', []),
+            shop_total_cost=shop.get('total_cost', 0),
+            shop_screenshot_path=shop.get('screenshot_path'),
+            error=board.get('error') or shop.get('error')
+        )
+        logger.info(f"Game state analysis completed in {record.analysis_duration:.2f}s")
+        
+        return record
+    
+    def _analyze_frame(
+        self,
+        detailed: bool = True
+    ) -> Optional[Tuple[int, Dict[str, Any], Dict[str, Any], Dict[str, str], Dict[str, str]]]:
+        """Capture one frame and run every region analysis on it.
+        
+        Args:
+            detailed: Passed to the board and shop analyses
+            
+        Returns:
+            Tuple of (timestamp, board analysis, shop analysis, resource texts,
+            game info texts), or None if nothing could be captured
+        """
         # Capture all regions
         captures = self.capture_full_game_state()
         
         if not captures:
             logger.error("No captures obtained")
-            return {"error": "Failed to capture screen"}
+            return None
         
-        # Analyze each component
-        analysis = {
-            "timestamp": int(time.time()),
-            "analysis_duration": 0,
-            "board": {},
-            "shop": {},
-            "resources": {},
-            "game_info": {}
+        timestamp = int(time.time())
+        
+        # Convert each analyzed region to grayscale once; fingerprinting, template
+        # matching and OCR all work from the same gray frame
+        captures_gray = {
+            name: cv2.cvtColor(captures[name], cv2.COLOR_BGR2GRAY)
+            for name in ['board', 'shop', 'gold', 'level', 'health', 'round'] if name in captures
+        }
+        
+        # Submit every independent region analysis, then collect the results
+        # Detailed and name-only results are cached separately
+        suffix = "" if detailed else ":names"
+        fut_board = self._submit_if_changed(
+            'board', captures, captures_gray,
+            lambda image, gray: self.analyze_board_state(image, gray, detailed=detailed), cache_key='board' + suffix
+        )
+        fut_shop = self._submit_if_changed(
+            'shop', captures, captures_gray,
+            lambda image, gray: self.analyze_shop_state(image, gray, detailed=detailed), cache_key='shop' + suffix
+        )
+        fut_resources = {
+            resource: self._pool.submit(self.extract_game_text, captures_gray[resource], resource)
+            for resource in ['gold', 'level', 'health'] if resource in captures_gray
+        }
+        fut_game_info = {
+            info: self._pool.submit(self.extract_game_text, captures_gray[info], info)
+            for info in ['round'] if info in captures_gray
         }
         
         # Analyze board
-        if 'board' in captures:
-            analysis["board"] = self.analyze_board_state(captures['board'])
+        board = self._remember_analysis('board' + suffix, fut_board.result()) if fut_board is not None else {}
         
         # Analyze shop
-        if 'shop' in captures:
-            analysis["shop"] = self.analyze_shop_state(captures['shop'])
+        shop = self._remember_analysis('shop' + suffix, fut_shop.result()) if fut_shop is not None else {}
         
         # Extract resource information
-        resources = {}
-        for resource in ['gold', 'level', 'health']:
-            if resource in captures:
-                text = self.extract_game_text(captures[resource], resource)
-                resources[resource] = text
-        analysis["resources"] = resources
+        resources = {resource: fut.result() for resource, fut in fut_resources.items()}
         
         # Extract game info
-        game_info = {}
-        for info in ['round']:
-            if info in captures:
-                text = self.extract_game_text(captures[info], info)
-                game_info[info] = text
-        analysis["game_info"] = game_info
-        
-        analysis["analysis_duration"] = time.time() - start_time
-        logger.info(f"Game state analysis completed in {analysis['analysis_duration']:.2f}s")
+        game_info = {info: fut.result() for info, fut in fut_game_info.items()}
         
-        return analysis
+        return timestamp, board, shop, resources, game_info
     
-    def get_strategic_advice(self, game_state: Dict[str, Any]) -> str:
+    def _submit_if_changed(
+        self,
+        region_name: str,
+        captures: Dict[str, np.ndarray],
+        captures_gray: Dict[str, np.ndarray],
+        analyze,
+        cache_key: Optional[str] = None
+    ) -> Optional[Future]:
+        """Submit a region analysis unless the region is unchanged since last frame.
+        
+        A previous result is reused for at most _REUSE_MAX_AGE seconds, so a
+        change too small for the thumbnail comparison can't go stale forever.
+        
+        Args:
+            region_name: Name of the region
+            captures: Captured region images
+            captures_gray: Grayscale versions of the captured regions
+            analyze: Analysis method to run on the region image and its gray version
+            cache_key: Key for the cached analysis, defaults to region_name
+            
+        Returns:
+            Future for the analysis (already resolved when reusing the previous
+            result), or None if the region wasn't captured
+        """
+        image = captures.get(region_name)
+        if image is None:
+            return None
+        
+        cache_key = cache_key or region_name
+        gray = captures_gray[region_name]
+        thumbnail = _region_thumbnail(gray)
+        now = time.time()
+        if (
+            cache_key in self._prev_analysis
+            and now - self._prev_analyzed_at.get(cache_key, 0.0) < _REUSE_MAX_AGE
+            and _thumbnails_match(self._prev_thumbnails.get(cache_key), thumbnail)
+        ):
+            logger.debug(f"{region_name} unchanged, reusing previous analysis")
+            # The previous frame's debug screenshot doesn't describe this frame
+            reused = {key: value for key, value in self._prev_analysis[cache_key].items() if key != "screenshot_path"}
+            future = Future()
+            future.set_result(reused)
+            return future
+        
+        self._prev_thumbnails[cache_key] = thumbnail
+        self._prev_analyzed_at[cache_key] = now
+        self._prev_analysis.pop(cache_key, None)
+        return self._pool.submit(analyze, image, gray)
+    
+    def _remember_analysis(self, cache_key: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache a region analysis for reuse while the region stays unchanged.
+        
+        Failed analyses are not cached, so the next frame retries them.
+        """
+        if "error" in result:
+            self._prev_thumbnails.pop(cache_key, None)
+        else:
+            self._prev_analysis[cache_key] = result
+        return result
+    
+    def get_strategic_advice(self, game_state: Union[Dict[str, Any], GameStateRecord]) -> str:
         """Get strategic advice based on the analyzed game state.
         
         Args:
-            game_state: Complete game state analysis
+            game_state: Complete game state analysis (dict or GameStateRecord)
             
         Returns:
             Strategic advice text
@@ -319,11 +771,11 @@ class TFTGameStateAnalyzer:
             logger.error(f"Error getting strategic advice: {e}")
             return f"Unable to provide strategic advice: {str(e)}"
     
-    def _build_strategic_prompt(self, game_state: Dict[str, Any]) -> str:
+    def _build_strategic_prompt(self, game_state: Union[Dict[str, Any], GameStateRecord]) -> str:
         """Build a strategic analysis prompt for Gemini.
         
         Args:
-            game_state: Complete game state analysis
+            game_state: Complete game state analysis (dict or GameStateRecord)
             
         Returns:
             Formatted prompt string
@@ -334,29 +786,39 @@ class TFTGameStateAnalyzer:
             "CURRENT GAME STATE:",
         ]
         
-        # Add resource information
-        if game_state.get("resources"):
-            resources = game_state["resources"]
-            prompt_parts.append(f"Gold: {resources.get('gold', 'unknown')}")
-            prompt_parts.append(f"Level: {resources.get('level', 'unknown')}")
-            prompt_parts.append(f"Health: {resources.get('health', 'unknown')}")
-        
-        # Add game information
-        if game_state.get("game_info"):
-            game_info = game_state["game_info"]
-            prompt_parts.append(f"Round: {game_info.get('round', 'unknown')}")
-        
-        # Add board information
-        if game_state.get("board"):
-            board = game_state["board"]
-            champion_count = board.get("champion_count", 0)
-            prompt_parts.append(f"Champions on board: {champion_count}")
-        
-        # Add shop information
-        if game_state.get("shop"):
-            shop = game_state["shop"]
-            if shop.get("screenshot_path"):
+        if isinstance(game_state, GameStateRecord):
+            # Records carry parsed stats, so read attributes directly
+            prompt_parts.append(f"Gold: {game_state.gold if game_state.gold is not None else 'unknown'}")
+            prompt_parts.append(f"Level: {game_state.level if game_state.level is not None else 'unknown'}")
+            prompt_parts.append(f"Health: {game_state.health if game_state.health is not None else 'unknown'}")
+            prompt_parts.append(f"Round: {game_state.round_stage or 'unknown'}")
+            prompt_parts.append(f"Champions on board: {game_state.champion_count}")
+            if game_state.shop_screenshot_path:
                 prompt_parts.append("Shop state captured for analysis")
+        else:
+            # Add resource information
+            if game_state.get("resources"):
+                resources = game_state["resources"]
+                prompt_parts.append(f"Gold: {resources.get('gold', 'unknown')}")
+                prompt_parts.append(f"Level: {resources.get('level', 'unknown')}")
+                prompt_parts.append(f"Health: {resources.get('health', 'unknown')}")
+            
+            # Add game information
+            if game_state.get("game_info"):
+                game_info = game_state["game_info"]
+                prompt_parts.append(f"Round: {game_info.get('round', 'unknown')}")
+            
+            # Add board information
+            if game_state.get("board"):
+                board = game_state["board"]
+                champion_count = board.get("champion_count", 0)
+                prompt_parts.append(f"Champions on board: {champion_count}")
+            
+            # Add shop information
+            if game_state.get("shop"):
+                shop = game_state["shop"]
+                if shop.get("screenshot_path"):
+                    prompt_parts.append("Shop state captured for analysis")
         
         prompt_parts.extend([
             "",
@@ -371,6 +833,34 @@ class TFTGameStateAnalyzer:
         
         return "\n".join(prompt_parts)
     
+    def _extract_stats_text(self, captures: Dict[str, np.ndarray]) -> Dict[str, str]:
+        """OCR the captured stat regions, in one Tesseract pass where possible.
+        
+        Falls back to one OCR call per region for any region the combined
+        strip read nothing for.
+        
+        Args:
+            captures: Captured stat region images
+            
+        Returns:
+            Mapping of region name to extracted text
+        """
+        names = list(captures)
+        texts = {}
+        if len(names) > 1:
+            # The strip scales every region to its row height itself, so no
+            # separate downscale pass here
+            lines = self.champion_detector.detect_text_in_strip([captures[name] for name in names], names)
+            if lines is not None:
+                texts = {name: line for name, line in zip(names, lines) if line is not None}
+        
+        missing = [name for name in names if name not in texts]
+        if len(names) > 1 and missing:
+            logger.debug(f"Stats strip OCR missed {missing}, falling back to per-region OCR for them")
+        for name in missing:
+            texts[name] = self.extract_game_text(captures[name], name)
+        return texts
+    
     def get_game_stats_only(self) -> Dict[str, Any]:
         """Get only the numerical game stats (gold, level, health, round) without champion detection.
         
@@ -395,40 +885,8 @@ class TFTGameStateAnalyzer:
         stats = {}
         
         try:
-            # Extract and parse gold
-            if 'gold' in captures:
-                gold_text = self.extract_game_text(captures['gold'], 'gold')
-                # Extract number from text (e.g. "50" from "Gold: 50")
-                import re
-                gold_match = re.search(r'(\d+)', gold_text)
-                if gold_match:
-                    stats['gold'] = int(gold_match.group(1))
-                    logger.debug(f"Detected gold: {stats['gold']}")
-            
-            # Extract and parse level
-            if 'level' in captures:
-                level_text = self.extract_game_text(captures['level'], 'level')
-                level_match = re.search(r'(\d+)', level_text)
-                if level_match:
-                    stats['level'] = int(level_match.group(1))
-                    logger.debug(f"Detected level: {stats['level']}")
-            
-            # Extract and parse health
-            if 'health' in captures:
-                health_text = self.extract_game_text(captures['health'], 'health')
-                health_match = re.search(r'(\d+)', health_text)
-                if health_match:
-                    stats['health'] = int(health_match.group(1))
-                    logger.debug(f"Detected health: {stats['health']}")
-            
-            # Extract round/stage
-            if 'round' in captures:
-                round_text = self.extract_game_text(captures['round'], 'round')
-                # Look for patterns like "4-2" or "Round 4-2"
-                round_match = re.search(r'(\d+-\d+)', round_text)
-                if round_match:
-                    stats['round_stage'] = round_match.group(1)
-                    logger.debug(f"Detected round: {stats['round_stage']}")
+            texts = self._extract_stats_text(captures)
+            stats = _parse_stats(texts)
         
         except Exception as e:
             logger.error(f"Error extracting game stats: {e}")
@@ -457,5 +915,5 @@ def analyze_current_game() -> Dict[str, Any]:
 def get_game_advice() -> str:
     """Convenience function to get strategic advice for current game state."""
     analyzer = get_game_analyzer()
-    game_state = analyzer.analyze_complete_game_state()
+    game_state = analyzer.analyze_game_state_record()
     return analyzer.get_strategic_advice(game_state)
\ No newline at end of file